@@ -278,16 +278,11 @@ class PyGitCLI:
             if args.all:
                 # Add all changes (respecting .gitignore)
                 added_files = 0
-                for file_path in repo.path.rglob("*"):
-                    if file_path.is_file():
-                        rel_path = str(file_path.relative_to(repo.path))
-
-                        # Skip ignored files
-                        if ignore_manager.is_ignored(rel_path, False):
-                            continue
+                for file_path in ignore_manager.walk():
+                    rel_path = str(file_path.relative_to(repo.path))
 
-                        if index.add(rel_path):
-                            added_files += 1
+                    if index.add(rel_path):
+                        added_files += 1
 
                 self.logger.info(f"Added {added_files} files to staging area")
             else:
@@ -340,15 +335,12 @@ class PyGitCLI:
 
             # Get untracked files
             all_files = []
-            for file_path in repo.path.rglob("*"):
-                if file_path.is_file():
-                    rel_path = str(file_path.relative_to(repo.path))
-                    # Skip git directory and ignored files
-                    if rel_path.startswith(".git") or ignore_manager.is_ignored(
-                        rel_path, False
-                    ):
-                        continue
-                    all_files.append(rel_path)
+            for file_path in ignore_manager.walk():
+                rel_path = str(file_path.relative_to(repo.path))
+                # Skip git metadata files (.gitignore, .gitattributes, ...)
+                if rel_path.startswith(".git"):
+                    continue
+                all_files.append(rel_path)
 
             tracked_files = set(index.entries.keys())
             untracked_files = [f for f in all_files if f not in tracked_files]
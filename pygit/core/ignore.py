@@ -7,17 +7,95 @@ functionality for PyGit operations.
 
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set, Pattern, Optional
+from typing import Callable, Iterator, List, Set, Pattern, Optional, Union
 from ..utils.logging import get_logger
 
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator for large pattern sets
+    hyperscan = None
+
+
+# Pattern count above which a Hyperscan database is worth compiling
+HYPERSCAN_MIN_PATTERNS = 32
+
+# Platforms whose default filesystems are case-insensitive
+_CASE_INSENSITIVE_PLATFORMS = ("darwin", "win32")
+
+
+@lru_cache(maxsize=1024)
+def _compile_gitignore(regex: str, flags: int) -> Pattern:
+    """Compile a translated gitignore regex, sharing results across instances."""
+    return re.compile(regex, flags)
+
+
+def _is_case_insensitive(path: Path) -> bool:
+    """Probe whether the filesystem holding path ignores case."""
+    probe = str(path)
+    swapped = probe.swapcase()
+
+    if swapped == probe or not os.path.exists(probe):
+        # Nothing to probe with - fall back to the platform default
+        return sys.platform in _CASE_INSENSITIVE_PLATFORMS
+
+    try:
+        return os.path.exists(swapped) and os.path.samefile(probe, swapped)
+    except OSError:
+        return False
+
+
+def _glob_to_regex(pattern: str) -> str:
+    """Translate a gitignore glob to an unanchored regex.
+
+    '*' and '?' never match '/', while '**' spans directories.
+    """
+    parts = []
+    i, n = 0, len(pattern)
+
+    while i < n:
+        if pattern.startswith("**/", i):
+            parts.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            parts.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            parts.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            parts.append("[^/]")
+            i += 1
+        elif pattern[i] == "[" and "]" in pattern[i + 2 :]:
+            # Character class; a leading ']' is part of the set
+            j = pattern.index("]", i + 2)
+            stuff = pattern[i + 1 : j].replace("\\", "\\\\")
+            if stuff[0] == "!":
+                stuff = "^" + stuff[1:]
+            elif stuff[0] == "^":
+                stuff = "\\" + stuff
+            parts.append(f"[{stuff}]")
+            i = j + 1
+        else:
+            parts.append(re.escape(pattern[i]))
+            i += 1
+
+    return "".join(parts)
+
 
 class GitIgnorePattern:
     """Represents a single .gitignore pattern."""
 
-    def __init__(self, pattern: str, source_file: str = None):
-        self.pattern = pattern
+    def __init__(
+        self, pattern: str, source_file: str = None, ignore_case: bool = None
+    ):
+        self.pattern = sys.intern(pattern)
         self.source_file = source_file
+        if ignore_case is None:
+            ignore_case = sys.platform in _CASE_INSENSITIVE_PLATFORMS
+        self.ignore_case = ignore_case
         self.negated = pattern.startswith("!")
         self.dir_only = pattern.endswith("/")
 
@@ -38,33 +116,16 @@ class GitIgnorePattern:
 
     def _pattern_to_regex(self, pattern: str) -> Pattern:
         """Convert glob pattern to regex."""
-        # Escape special regex characters except * and ?
-        escaped = re.escape(pattern)
-
-        # Convert escaped wildcards back to regex equivalents
-        escaped = escaped.replace(r"\*", ".*")
-        escaped = escaped.replace(r"\?", ".")
-
-        # Handle character ranges like [abc]
-        escaped = escaped.replace(r"\[", "[").replace(r"\]", "]")
-
-        # Handle ** for recursive matching
-        escaped = escaped.replace(r"\*\*/\*", ".*/.*")
-        escaped = escaped.replace(r"\*\*", ".*")
+        escaped = _glob_to_regex(pattern)
 
         # If pattern doesn't start with anchor, match anywhere in path
         if not self.absolute and not pattern.startswith("**"):
-            if "/" in escaped:
-                # Complex pattern - need to handle directory structure
-                escaped = f"(^|.*/)({escaped})(/.*|$)"
-            else:
-                # Simple pattern - can match anywhere in the path
-                escaped = f"(^|.*/)({escaped})(/.*|$)"
+            escaped = f"(^|.*/)({escaped})(/.*|$)"
         else:
             # Absolute pattern - match from beginning
             escaped = f"^{escaped}(/.*)?$"
 
-        return re.compile(escaped, flags=re.IGNORECASE if os.name == "nt" else 0)
+        return _compile_gitignore(escaped, re.IGNORECASE if self.ignore_case else 0)
 
     def matches(self, path: str, is_dir: bool = False) -> bool:
         """Check if this pattern matches the given path."""
@@ -85,13 +146,17 @@ class GitIgnore:
 
     def __init__(self, repository_root: Path):
         self.repository_root = repository_root
+        self.ignore_case = _is_case_insensitive(repository_root)
         self.patterns: List[GitIgnorePattern] = []
         self.logger = get_logger()
+        self._hs_db = None
+        self._matcher: Optional[Callable[[str, bool], bool]] = None
         self._load_ignore_files()
 
     def _load_ignore_files(self):
         """Load ignore files from various locations."""
         self.patterns.clear()
+        self._invalidate_matcher()
 
         # Load repository-level .gitignore
         self._load_ignore_file(self.repository_root / ".gitignore")
@@ -107,30 +172,30 @@ class GitIgnore:
 
     def _load_ignore_file(self, ignore_file: Path):
         """Load patterns from a single ignore file."""
-        if not ignore_file.exists() or not ignore_file.is_file():
-            return
-
         try:
-            lines = ignore_file.read_text(encoding="utf-8", errors="ignore")
-
-            for line_num, line in enumerate(lines.splitlines(), 1):
-                line = line.strip()
-
-                # Skip empty lines and comments
-                if not line or line.startswith("#"):
-                    continue
-
-                try:
-                    pattern = GitIgnorePattern(line, str(ignore_file))
-                    self.patterns.append(pattern)
-
-                except Exception as e:
-                    self.logger.debug(
-                        f"Invalid ignore pattern '{line}' in {ignore_file}:{line_num}: {e}"
-                    )
-
+            text = ignore_file.read_text(encoding="utf-8", errors="ignore")
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return
         except Exception as e:
             self.logger.warning(f"Could not read ignore file {ignore_file}: {e}")
+            return
+
+        # Strip and drop empty lines and comments in one pass
+        stripped = [line.strip() for line in text.splitlines()]
+        candidates = [
+            (line_num, line)
+            for line_num, line in enumerate(stripped, 1)
+            if line and not line.startswith("#")
+        ]
+
+        source = str(ignore_file)
+        for line_num, line in candidates:
+            try:
+                self.patterns.append(GitIgnorePattern(line, source, self.ignore_case))
+            except Exception as e:
+                self.logger.debug(
+                    f"Invalid ignore pattern '{line}' in {ignore_file}:{line_num}: {e}"
+                )
 
     def is_ignored(self, path: str, is_dir: bool = False) -> bool:
         """Check if a path is ignored."""
@@ -147,7 +212,11 @@ class GitIgnore:
         # Normalize path separators
         rel_path = rel_path.replace(os.sep, "/")
 
-        # Check each pattern in order
+        matcher = self._matcher or self._build_matcher()
+        return matcher(rel_path, is_dir)
+
+    def _is_ignored_sequential(self, rel_path: str, is_dir: bool) -> bool:
+        """Check each pattern in order; the last match wins."""
         ignored = False
 
         for pattern in self.patterns:
@@ -159,6 +228,96 @@ class GitIgnore:
 
         return ignored
 
+    def _invalidate_matcher(self):
+        """Drop any matcher compiled from the current pattern list."""
+        self._hs_db = None
+        self._matcher = None
+
+    def _build_matcher(self) -> Callable[[str, bool], bool]:
+        """Pick the fastest matcher for the loaded pattern set."""
+        self._hs_db = self._build_hyperscan_db()
+
+        if self._hs_db is not None:
+            matcher = self._is_ignored_hyperscan
+        elif any(p.negated for p in self.patterns):
+            # Negations make order significant - keep the sequential scan
+            matcher = self._is_ignored_sequential
+        else:
+            matcher = self._specialize()
+
+        self._matcher = matcher
+        return matcher
+
+    def _specialize(self) -> Callable[[str, bool], bool]:
+        """Build a matcher for a negation-free pattern set.
+
+        Without negations a path is ignored if any pattern matches, so all
+        patterns collapse into two alternations: one that applies to every
+        path and one that only applies to directories.
+        """
+        flags = re.IGNORECASE if self.ignore_case else 0
+
+        def combine(patterns: List[GitIgnorePattern]):
+            if not patterns:
+                return lambda path: None
+            source = "|".join(f"(?:{p.regex.pattern})" for p in patterns)
+            return re.compile(source, flags).match
+
+        any_match = combine([p for p in self.patterns if not p.dir_only])
+        dir_match = combine([p for p in self.patterns if p.dir_only])
+
+        def matcher(path: str, is_dir: bool) -> bool:
+            if any_match(path) is not None:
+                return True
+            return is_dir and dir_match(path) is not None
+
+        return matcher
+
+    def _build_hyperscan_db(self):
+        """Compile all patterns into one Hyperscan database if worthwhile."""
+        if hyperscan is None or len(self.patterns) <= HYPERSCAN_MIN_PATTERNS:
+            return None
+
+        flags = (
+            hyperscan.HS_FLAG_SINGLEMATCH
+            | hyperscan.HS_FLAG_ALLOWEMPTY
+            | hyperscan.HS_FLAG_UTF8
+        )
+        if self.ignore_case:
+            flags |= hyperscan.HS_FLAG_CASELESS
+
+        db = hyperscan.Database()
+        try:
+            db.compile(
+                expressions=[p.regex.pattern.encode() for p in self.patterns],
+                ids=list(range(len(self.patterns))),
+                elements=len(self.patterns),
+                flags=flags,
+            )
+        except hyperscan.error as e:
+            self.logger.debug(f"Hyperscan unavailable for ignore patterns: {e}")
+            return None
+
+        return db
+
+    def _is_ignored_hyperscan(self, rel_path: str, is_dir: bool) -> bool:
+        """Match rel_path against every pattern in a single Hyperscan scan."""
+        matched = set()
+
+        def on_match(pattern_id, start, end, flags, context):
+            matched.add(pattern_id)
+
+        self._hs_db.scan(rel_path.encode(), match_event_handler=on_match)
+
+        # Last matching pattern wins, as in the sequential scan
+        for pattern_id in sorted(matched, reverse=True):
+            pattern = self.patterns[pattern_id]
+            if pattern.dir_only and not is_dir:
+                continue
+            return not pattern.negated
+
+        return False
+
     def filter_files(self, files: List[str]) -> List[str]:
         """Filter a list of files, removing ignored ones."""
         return [f for f in files if not self.is_ignored(f, False)]
@@ -177,6 +336,29 @@ class GitIgnore:
 
         return result
 
+    def walk(self, root: Union[str, Path] = None) -> Iterator[Path]:
+        """Yield non-ignored files under root, pruning ignored directories.
+
+        Ignored directories (and .git) are removed from the walk before
+        descending, so nothing inside e.g. node_modules/ is ever stat'ed.
+        """
+        root = Path(root) if root is not None else self.repository_root
+
+        for dirpath, dirnames, filenames in os.walk(root, topdown=True):
+            rel_dir = os.path.relpath(dirpath, self.repository_root)
+            prefix = "" if rel_dir == os.curdir else rel_dir + os.sep
+
+            # Prune in place so os.walk never descends into ignored directories
+            dirnames[:] = [
+                d
+                for d in dirnames
+                if d != ".git" and not self.is_ignored(prefix + d, True)
+            ]
+
+            for name in filenames:
+                if not self.is_ignored(prefix + name, False):
+                    yield Path(dirpath) / name
+
     def get_ignored_files(self, paths: List[Path]) -> List[Path]:
         """Get list of paths that are ignored."""
         ignored = []
@@ -194,8 +376,9 @@ class GitIgnore:
     def add_pattern(self, pattern: str):
         """Add a new ignore pattern (in-memory only)."""
         try:
-            git_pattern = GitIgnorePattern(pattern)
+            git_pattern = GitIgnorePattern(pattern, ignore_case=self.ignore_case)
             self.patterns.append(git_pattern)
+            self._invalidate_matcher()
         except Exception as e:
             self.logger.error(f"Invalid ignore pattern '{pattern}': {e}")
 
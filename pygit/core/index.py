@@ -7,7 +7,9 @@ including staging files, tracking changes, and preparing commits.
 
 import os
 import sys
+import array
 import struct
+import hashlib
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional, Set
 from datetime import datetime
@@ -16,6 +18,14 @@ from .repository import Repository
 from ..utils.logging import get_logger
 
 
+# Index file header: signature, version, entry count
+_INDEX_HEADER = struct.Struct(">4sII")
+
+# Fixed-size part of a serialized entry: ctime, mtime, dev, ino, mode, uid,
+# gid, 12 reserved bytes, SHA-1, flags, size (66 bytes)
+_ENTRY_HEADER = struct.Struct(">7I12x20sHI")
+
+
 class IndexEntry:
     """Represents a single entry in the Git index."""
 
@@ -34,7 +44,8 @@ class IndexEntry:
         mtime: float = None,
         ctime: float = None,
     ):
-        self.path = path
+        # Interned so dict lookups by path hit the identity fast path
+        self.path = sys.intern(path)
         self.sha1 = sha1
         self.mode = mode
         self.size = size
@@ -61,44 +72,54 @@ class IndexEntry:
             # Use defaults if stat fails
             pass
 
-        # Git specific fields
-        self.flags = min(len(path), 0xFFFF)  # Ensure flags fit in 16-bit
+        # Git specific fields: stage 0 in bits 12-13, UTF-8 name length in
+        # the low 12 bits (0xFFF meaning "0xFFF or longer")
+        self.flags = min(len(path.encode("utf-8")), 0xFFF)
 
-    def serialize(self) -> bytes:
-        """Serialize the index entry for writing to the index file."""
-        # Entry structure (62 bytes + path + null padding)
-        data = bytearray(66)  # Need 66 bytes for header
+    def packed_size(self) -> int:
+        """Return the number of bytes serialize() produces for this entry."""
+        path_len = len(self.path.encode("utf-8")) + 1
+        padding_len = (8 - (62 + path_len) % 8) % 8
+        return _ENTRY_HEADER.size + path_len + padding_len
 
-        # Write timestamps (ensure they fit in 32-bit unsigned)
+    def serialize_into(self, buffer: bytearray, offset: int) -> int:
+        """Serialize the entry into buffer at offset and return the end offset."""
+        # Timestamps must fit in 32-bit unsigned
         ctime_val = int(self.ctime) if int(self.ctime) <= 0xFFFFFFFF else 0
         mtime_val = int(self.mtime) if int(self.mtime) <= 0xFFFFFFFF else 0
-        struct.pack_into(">I", data, 0, ctime_val)
-        struct.pack_into(">I", data, 4, mtime_val)
 
-        # Write device and inode
-        struct.pack_into(">I", data, 8, self.dev)
-        struct.pack_into(">I", data, 12, self.ino)
-
-        # Write mode and uid/gid
-        struct.pack_into(">I", data, 16, self.mode)
-        struct.pack_into(">I", data, 20, self.uid)
-        struct.pack_into(">I", data, 24, self.gid)
-
-        # Write SHA1
-        sha1_bytes = bytes.fromhex(self.sha1)
-        struct.pack_into("20s", data, 40, sha1_bytes)
+        _ENTRY_HEADER.pack_into(
+            buffer,
+            offset,
+            ctime_val,
+            mtime_val,
+            self.dev,
+            self.ino,
+            self.mode,
+            self.uid,
+            self.gid,
+            bytes.fromhex(self.sha1),
+            self.flags,
+            self.size,
+        )
+        offset += _ENTRY_HEADER.size
 
-        # Write flags and size
-        struct.pack_into(">H", data, 60, self.flags)
-        struct.pack_into(">I", data, 62, self.size)
+        # Path with null terminator, padded to 8-byte boundary
+        path_bytes = self.path.encode("utf-8")
+        path_len = len(path_bytes) + 1
+        padding_len = (8 - (62 + path_len) % 8) % 8
+        end = offset + path_len + padding_len
+        path_end = offset + len(path_bytes)
+        buffer[offset:path_end] = path_bytes
+        buffer[path_end:end] = bytes(end - path_end)
 
-        # Add path with null terminator and pad to 8-byte boundary
-        path_bytes = self.path.encode("utf-8") + b"\x00"
-        entry_size = 62 + len(path_bytes)
-        padding_len = (8 - entry_size % 8) % 8
-        path_bytes += b"\x00" * padding_len
+        return end
 
-        return bytes(data + path_bytes)
+    def serialize(self) -> bytes:
+        """Serialize the index entry for writing to the index file."""
+        data = bytearray(self.packed_size())
+        self.serialize_into(data, 0)
+        return bytes(data)
 
     @classmethod
     def deserialize(cls, data: bytes, offset: int) -> Tuple["IndexEntry", int]:
@@ -150,6 +171,11 @@ class Index:
         self.repository = repository
         self.entries: Dict[str, IndexEntry] = {}
         self.logger = get_logger()
+        # Column-wise (path, size, mtime, raw sha) copy of the entries used
+        # by bulk stat scans; rebuilt lazily after the entries change.
+        self._columns: Optional[
+            Tuple[List[str], array.array, array.array, bytearray]
+        ] = None
         self._load()
 
     def _load(self):
@@ -205,16 +231,31 @@ class Index:
         """Save the index to disk."""
         index_path = self.repository.git_dir / "index"
 
-        # Prepare header
-        header = struct.pack(">4sII", b"DIRC", 2, len(self.entries))
+        entries = sorted(self.entries.values(), key=lambda e: e.path)
+
+        # Size the whole file up front: header, entries, trailing SHA-1
+        total = _INDEX_HEADER.size + sum(e.packed_size() for e in entries) + 20
+        data = bytearray(total)
+
+        # Hash each chunk right after it is serialized, while it is still
+        # in cache, instead of re-reading the whole buffer at the end
+        view = memoryview(data)
+        hasher = hashlib.sha1()
 
-        # Serialize entries
-        entries_data = bytearray()
-        for entry in sorted(self.entries.values(), key=lambda e: e.path):
-            entries_data.extend(entry.serialize())
+        _INDEX_HEADER.pack_into(data, 0, b"DIRC", 2, len(entries))
+        offset = _INDEX_HEADER.size
+        hasher.update(view[:offset])
+
+        for entry in entries:
+            end = entry.serialize_into(data, offset)
+            hasher.update(view[offset:end])
+            offset = end
+
+        view.release()
+        data[offset:] = hasher.digest()
 
         # Write file
-        index_path.write_bytes(header + entries_data)
+        index_path.write_bytes(data)
         self.logger.debug(f"Saved {len(self.entries)} entries to index")
 
     def add(self, path: str, repo_path: Path = None) -> bool:
@@ -222,6 +263,7 @@ class Index:
         if repo_path is None:
             repo_path = self.repository.path
 
+        path = sys.intern(path)
         full_path = repo_path / path
 
         if not full_path.exists():
@@ -256,6 +298,7 @@ class Index:
             )
 
             self.entries[path] = entry
+            self._columns = None
             self.logger.object_operation("add", "blob", sha1)
             return True
 
@@ -267,6 +310,7 @@ class Index:
         """Remove a file from the index."""
         if path in self.entries:
             del self.entries[path]
+            self._columns = None
             self.logger.debug(f"Removed {path} from index")
             return True
         return False
@@ -274,6 +318,7 @@ class Index:
     def clear(self):
         """Clear all entries from the index."""
         self.entries.clear()
+        self._columns = None
         self.logger.debug("Cleared index")
 
     def get_entry(self, path: str) -> Optional[IndexEntry]:
@@ -288,30 +333,41 @@ class Index:
         """Check if a file is tracked in the index."""
         return path in self.entries
 
+    def _get_columns(self) -> Tuple[List[str], array.array, array.array, bytearray]:
+        """Return the hot entry fields as parallel arrays."""
+        if self._columns is None or len(self._columns[0]) != len(self.entries):
+            entries = list(self.entries.values())
+            paths = list(self.entries)
+            sizes = array.array("q", [e.size for e in entries])
+            mtimes = array.array("q", [int(e.mtime) for e in entries])
+            shas = bytearray(b"".join(bytes.fromhex(e.sha1) for e in entries))
+            self._columns = (paths, sizes, mtimes, shas)
+        return self._columns
+
     def get_modified_files(self, repo_path: Path = None) -> Dict[str, str]:
         """Get modified files compared to working directory."""
         if repo_path is None:
             repo_path = self.repository.path
 
         modified = {}
+        paths, sizes, mtimes, shas = self._get_columns()
 
-        for path, entry in self.entries.items():
+        for i, (path, size, mtime) in enumerate(zip(paths, sizes, mtimes)):
             full_path = repo_path / path
 
-            if not full_path.exists():
+            try:
+                stat = os.stat(full_path)
+            except (FileNotFoundError, NotADirectoryError):
                 modified[path] = "deleted"
                 continue
 
             # Check if file was modified
-            current_mtime = full_path.stat().st_mtime
-            current_size = full_path.stat().st_size
-
-            if current_mtime != entry.mtime or current_size != entry.size:
+            if stat.st_mtime != mtime or stat.st_size != size:
                 # Check if content actually changed
                 try:
                     content = full_path.read_bytes()
                     blob = Blob(content)
-                    if blob.sha1() != entry.sha1:
+                    if bytes.fromhex(blob.sha1()) != shas[i * 20 : i * 20 + 20]:
                         modified[path] = "modified"
                 except:
                     modified[path] = "modified"
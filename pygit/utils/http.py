@@ -5,61 +5,286 @@ This module provides reusable HTTP operations for file downloads,
 API requests, and network operations.
 """
 
+import email.utils
+import gzip
+import http.client
 import os
-import urllib.request
+import random
+import socket
+import threading
+import time
 import urllib.error
+import urllib.parse
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, Union, Callable
+from typing import Dict, Iterable, Optional, Tuple, Union, Callable
+# Bound at import so each download attempt is a single global lookup rather
+# than an attribute walk through urllib.request. Keep these direct imports;
+# tests patch pygit.utils.http.urlopen and pygit.utils.http.Request.
+from urllib.request import Request, urlopen
 from .logging import get_logger
 
 
+# Read size for streamed downloads
+CHUNK_SIZE = 64 * 1024
+
+# Progress callbacks fire at most once per this many bytes or seconds,
+# plus a final call when the download completes
+PROGRESS_MIN_BYTES = 5 * 1024 * 1024
+PROGRESS_MIN_INTERVAL = 0.25
+
+# Default headers for make_request; API responses are mostly JSON and text
+# that compress several-fold. Downloads do not ask for compression, since it
+# would conflict with Range resume and Content-Length progress reporting.
+REQUEST_HEADERS = {"Accept-Encoding": "gzip, deflate"}
+
+# Circuit breaker: after this many consecutive download_with_retry calls to
+# one host fail on network errors, timeouts or 5xx responses, each within
+# BREAKER_WINDOW seconds of the last, further downloads from it fail fast
+# until BREAKER_WINDOW passes without failures
+BREAKER_THRESHOLD = 5
+BREAKER_WINDOW = 60.0
+
+# Seconds a resolved address is reused when PYGIT_DNS_CACHE=1
+DNS_CACHE_TTL = 60.0
+# Most lookups cached at once; the oldest is dropped beyond this
+DNS_CACHE_SIZE = 256
+
+
 class HTTPClient:
-    """HTTP client for downloading files and making requests."""
+    """HTTP client for downloading files and making requests.
 
-    def __init__(self, progress_callback: Optional[Callable[[int, int], None]] = None):
+    Requests go through urllib.request so PyGit keeps its zero-dependency,
+    pure-standard-library install; a requests.Session or urllib3 pool would
+    add the first runtime dependency for connection reuse.
+    """
+
+    def __init__(
+        self,
+        progress_callback: Optional[Callable[[int, int], None]] = None,
+        timeout: float = 30.0,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        jitter: bool = True,
+    ):
         self.progress_callback = progress_callback
+        # Socket timeout in seconds for every request this client makes
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
         self.logger = get_logger()
 
+    def __enter__(self) -> "HTTPClient":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release per-client resources.
+
+        urllib opens a connection per request and the client keeps no other
+        state, so there is currently nothing to release.
+        """
+
     def download_file(
         self, url: str, destination: Union[str, Path], create_dirs: bool = True
     ) -> bool:
         """Download a file from URL to destination."""
-        destination = Path(destination)
+        try:
+            self._download(url, Path(destination), create_dirs)
+            return True
+        except urllib.error.HTTPError as e:
+            self._log_http_error(url, e)
+            return False
+        except Exception as e:
+            self.logger.error(f"Error downloading {url}: {e}")
+            return False
+
+    def _download(
+        self,
+        url: str,
+        destination: Path,
+        create_dirs: bool,
+        resume: bool = False,
+        validators: Optional[Dict[str, str]] = None,
+    ):
+        """Download url to destination, raising on any failure.
 
-        if create_dirs:
-            destination.parent.mkdir(parents=True, exist_ok=True)
+        Data is streamed into a ``.part`` file next to the destination and
+        only renamed into place once complete, so a failed transfer never
+        leaves a truncated file under the final name. With resume, bytes
+        already in the ``.part`` file are kept on failure and requested
+        again only from where they stop. validators carries the ETag or
+        Last-Modified of the response that wrote them between attempts.
+        """
+        if create_dirs and not os.path.isdir(destination.parent):
+            # Bulk downloads mostly land in existing directories; a single
+            # stat settles those before falling back to makedirs
+            os.makedirs(destination.parent, exist_ok=True)
 
+        part_path = self._part_path(destination)
         try:
-            with urllib.request.urlopen(url) as response:
-                # Get file size for progress tracking
-                content_length = response.getheader("Content-Length")
-                total_size = int(content_length) if content_length else None
+            offset = part_path.stat().st_size if resume else 0
+        except FileNotFoundError:
+            offset = 0
 
-                downloaded = 0
-                chunk_size = 8192
+        try:
+            self._download_to(url, part_path, offset, validators)
+            os.replace(part_path, destination)
+        except BaseException:
+            if not resume:
+                part_path.unlink(missing_ok=True)
+            raise
 
-                with destination.open("wb") as f:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
+        self.logger.debug(f"Successfully downloaded {url} to {destination}")
 
-                        f.write(chunk)
-                        downloaded += len(chunk)
+    @staticmethod
+    def _part_path(destination: Path) -> Path:
+        """Return the temporary file a download streams into."""
+        return destination.with_name(destination.name + ".part")
 
-                        if self.progress_callback and total_size:
-                            self.progress_callback(downloaded, total_size)
+    def _download_to(
+        self,
+        url: str,
+        destination: Path,
+        offset: int = 0,
+        validators: Optional[Dict[str, str]] = None,
+    ):
+        """Stream the body of url into destination, resuming at offset.
 
-            self.logger.debug(f"Successfully downloaded {url} to {destination}")
-            return True
+        A resume is only attempted with an If-Range validator from the
+        response that wrote the first offset bytes, so a resource that has
+        changed since comes back whole instead of being spliced onto stale
+        data. validators is updated whenever a full body is fetched.
+        """
+        if validators is None:
+            validators = {}
+        if offset and "If-Range" not in validators:
+            offset = 0
 
+        request = url
+        if offset:
+            headers = {"Range": f"bytes={offset}-", "If-Range": validators["If-Range"]}
+            request = Request(url, headers=headers)
+
+        try:
+            response = urlopen(request, timeout=self.timeout)
         except urllib.error.HTTPError as e:
-            if e.code != 404:
-                self.logger.error(f"HTTP Error {e.code} downloading {url}: {e.reason}")
-            return False
-        except Exception as e:
-            self.logger.error(f"Error downloading {url}: {e}")
-            return False
+            if not offset or e.code != 416:
+                raise
+            # Range Not Satisfiable: the partial data already covers the
+            # whole resource, or it shrank. Drop it and fetch the body whole
+            e.close()
+            destination.unlink(missing_ok=True)
+            validators.clear()
+            return self._download_to(url, destination, 0, validators)
+
+        with response:
+            # 206 means the server honored the Range; anything else is the
+            # full body and the partial data is discarded
+            if not offset or getattr(response, "status", None) != 206:
+                validators.clear()
+                validators.update(self._validators(response))
+                self._write_body(response, destination, 0)
+                return
+            if self._content_range_start(response) == offset:
+                self._write_body(response, destination, offset)
+                return
+
+        # The server sent a different range than requested; start over
+        self._download_to(url, destination, 0, validators)
+
+    def _write_body(self, response, destination: Path, offset: int):
+        """Write response's body to destination after its first offset bytes."""
+        # Get file size for progress tracking
+        content_length = response.getheader("Content-Length")
+        total_size = offset + int(content_length) if content_length else None
+
+        downloaded = offset
+        # One reusable buffer; readinto fills it in place instead of
+        # allocating a new bytes object per chunk. shutil.copyfileobj is
+        # no faster here: it is a Python read()/write() loop as well,
+        # and allocates a fresh bytes object for every chunk
+        buffer = bytearray(CHUNK_SIZE)
+        view = memoryview(buffer)
+
+        report = self.progress_callback if total_size else None
+        reported_bytes = downloaded
+        reported_time = time.monotonic()
+
+        with destination.open("ab" if offset else "wb") as f:
+            preallocated = (
+                total_size and not offset and self._preallocate(f, total_size)
+            )
+            try:
+                while True:
+                    n = response.readinto(buffer)
+                    if not n:
+                        break
+
+                    f.write(view[:n])
+                    downloaded += n
+
+                    if report and (
+                        downloaded - reported_bytes >= PROGRESS_MIN_BYTES
+                        or time.monotonic() - reported_time
+                        >= PROGRESS_MIN_INTERVAL
+                    ):
+                        report(downloaded, total_size)
+                        reported_bytes = downloaded
+                        reported_time = time.monotonic()
+            finally:
+                if preallocated:
+                    # Drop reserved space the body did not fill, so a
+                    # resumed download continues from the real size
+                    f.truncate()
+
+        if report and reported_bytes != downloaded:
+            report(downloaded, total_size)
+
+    @staticmethod
+    def _validators(response) -> Dict[str, str]:
+        """Return the If-Range header that can resume response's body."""
+        etag = response.getheader("ETag")
+        # If-Range needs a strong validator; weak ETags never match
+        if etag and not etag.startswith("W/"):
+            return {"If-Range": etag}
+        last_modified = response.getheader("Last-Modified")
+        return {"If-Range": last_modified} if last_modified else {}
+
+    @staticmethod
+    def _content_range_start(response) -> Optional[int]:
+        """Return the first byte position of a 206 response's Content-Range."""
+        value = response.getheader("Content-Range") or ""
+        unit, _, byte_range = value.partition(" ")
+        start, dash, _ = byte_range.partition("-")
+        if unit != "bytes" or not dash or not start.isdigit():
+            return None
+        return int(start)
+
+    @staticmethod
+    def _preallocate(f, size: int) -> bool:
+        """Reserve size bytes for f up front where the platform supports it.
+
+        The filesystem can then lay the file out in one go instead of
+        extending it on every write. Returns True if space was reserved.
+        """
+        try:
+            os.posix_fallocate(f.fileno(), 0, size)
+        except (AttributeError, OSError):
+            return False  # Not available on this platform or filesystem
+        return True
+
+    def _log_http_error(self, url: str, error: urllib.error.HTTPError):
+        """Log an HTTP error; a missing file (404) is expected and stays quiet."""
+        if error.code != 404:
+            self.logger.error(
+                f"HTTP Error {error.code} downloading {url}: {error.reason}"
+            )
 
     def download_with_retry(
         self,
@@ -68,34 +293,206 @@ class HTTPClient:
         max_retries: int = 3,
         create_dirs: bool = True,
     ) -> bool:
-        """Download a file with retry logic."""
-        for attempt in range(max_retries):
-            if self.download_file(url, destination, create_dirs):
-                return True
+        """Download a file with retry logic.
 
-            if attempt < max_retries - 1:
-                wait_time = 2**attempt  # Exponential backoff
-                self.logger.info(
-                    f"Retrying download in {wait_time}s (attempt {attempt + 2}/{max_retries})"
-                )
-                import time
+        Only transient failures are retried: connection errors, timeouts,
+        408/429 and 5xx responses. Other client errors such as 401 or 404
+        fail immediately since repeating the request cannot succeed.
+        Retries resume from the bytes already received using an HTTP Range
+        request when the server supports it.
+
+        Calls that exhaust their retries on network errors, timeouts or 5xx
+        responses count against the URL's host; local errors such as an
+        unwritable destination do not. Once BREAKER_THRESHOLD have failed in
+        a row, downloads from that host return False without a request until
+        BREAKER_WINDOW seconds pass. A single call is then let through as a
+        probe, and any response other than a 5xx closes the circuit again.
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        if not _circuit_allows(host):
+            self.logger.warning(f"Skipping {url}: {host} is failing repeatedly")
+            return False
+
+        destination = Path(destination)
+        part_path = self._part_path(destination)
+        # Never resume from a .part file left behind by an unrelated run
+        if not self._remove_part(part_path):
+            # Says nothing about the host, but ends a half-open probe
+            _record_host_result(host, None)
+            return False
+        try:
+            return self._download_with_retry(
+                url, destination, max_retries, create_dirs, host
+            )
+        finally:
+            # Nothing is left to resume once retrying is over
+            self._remove_part(part_path)
+
+    def _remove_part(self, part_path: Path) -> bool:
+        """Delete a leftover .part file, returning False if that fails."""
+        try:
+            part_path.unlink(missing_ok=True)
+        except OSError as e:
+            self.logger.error(f"Cannot remove {part_path}: {e}")
+            return False
+        return True
+
+    def _download_with_retry(
+        self,
+        url: str,
+        destination: Path,
+        max_retries: int,
+        create_dirs: bool,
+        host: str,
+    ) -> bool:
+        """Run download attempts for download_with_retry."""
+        # Lets a retry resume only the response the .part file came from
+        validators: Dict[str, str] = {}
+        # Whether the last attempt showed the host down (True), up (False)
+        # or said nothing about it, as with local file errors (None)
+        host_failed = None
+        try:
+            for attempt in range(max_retries):
+                retry_after = 0.0
+                try:
+                    self._download(url, destination, create_dirs, True, validators)
+                    host_failed = False
+                    return True
+                except urllib.error.HTTPError as e:
+                    self._log_http_error(url, e)
+                    host_failed = e.code == 408 or e.code >= 500
+                    if not self._is_retryable_status(e.code):
+                        return False
+                    # Never let a server park the thread beyond our own cap
+                    retry_after = min(self._retry_after(e), self.max_delay)
+                except (
+                    urllib.error.URLError,
+                    http.client.HTTPException,
+                    ConnectionError,
+                    TimeoutError,
+                ) as e:
+                    self.logger.error(f"Error downloading {url}: {e}")
+                    host_failed = True
+                except OSError as e:
+                    self.logger.error(f"Error downloading {url}: {e}")
+                    host_failed = None
+                except Exception as e:
+                    self.logger.error(f"Error downloading {url}: {e}")
+                    host_failed = None
+                    return False
+
+                if attempt < max_retries - 1:
+                    # A server-provided Retry-After is a lower bound on the wait
+                    wait_time = max(self._backoff_delay(attempt), retry_after)
+                    self.logger.info(
+                        f"Retrying download in {wait_time:.1f}s "
+                        f"(attempt {attempt + 2}/{max_retries})"
+                    )
+                    time.sleep(wait_time)
+
+            self.logger.error(f"Failed to download {url} after {max_retries} attempts")
+            return False
+        finally:
+            _record_host_result(host, host_failed)
+
+    def download_many(
+        self,
+        jobs: Iterable[Tuple[str, Union[str, Path]]],
+        max_workers: int = 8,
+        max_retries: int = 3,
+    ) -> Dict[str, bool]:
+        """Download several (url, destination) pairs concurrently.
+
+        Each job runs download_with_retry on a bounded thread pool so network
+        latency overlaps across files. Returns a mapping of URL to success;
+        one failed download does not affect the others.
+        """
+        jobs = list(jobs)
+        if not jobs:
+            return {}
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+            futures = {
+                executor.submit(self.download_with_retry, url, dest, max_retries): url
+                for url, dest in jobs
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        return results
 
-                time.sleep(wait_time)
+    @staticmethod
+    def _is_retryable_status(code: int) -> bool:
+        """Return True for HTTP status codes worth retrying."""
+        return code in (408, 429) or 500 <= code < 600
 
-        self.logger.error(f"Failed to download {url} after {max_retries} attempts")
-        return False
+    @staticmethod
+    def _retry_after(error: urllib.error.HTTPError) -> float:
+        """Return the Retry-After delay in seconds requested by the server.
+
+        The header is either a non-negative integer number of seconds or an
+        HTTP-date; anything else, such as "inf" or "-5", is ignored. The
+        result is unbounded, so callers clamp it.
+        """
+        value = error.headers.get("Retry-After") if error.headers else None
+        if not value:
+            return 0.0
+        value = value.strip()
+        if value.isascii() and value.isdigit():
+            return float(int(value))
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError, OverflowError):
+            return 0.0
+
+    def _backoff_delay(self, attempt: int) -> float:
+        """Return the sleep before retry number attempt + 1.
+
+        Exponential backoff capped at max_delay; with jitter the delay is
+        drawn uniformly from [0, cap] ("full jitter") so clients that failed
+        together do not retry in lockstep.
+        """
+        cap = min(self.base_delay * (2**attempt), self.max_delay)
+        return random.uniform(0, cap) if self.jitter else cap
+
+    def is_accessible(self, url: str, timeout: Optional[float] = None) -> bool:
+        """Check if a URL is accessible.
+
+        Sends a HEAD request so only headers cross the wire. Servers that
+        reject HEAD with 405 get a GET limited to the first byte instead.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        request = Request(url, method="HEAD")
+        try:
+            with urlopen(request, timeout=timeout):
+                return True
+        except urllib.error.HTTPError as e:
+            if e.code != 405:
+                return False
+        except Exception:
+            return False
+
+        request = Request(url, headers={"Range": "bytes=0-0"})
+        try:
+            with urlopen(request, timeout=timeout):
+                return True
+        except Exception:
+            return False
 
     def make_request(self, url: str, headers: Optional[dict] = None) -> Optional[bytes]:
         """Make a simple HTTP GET request."""
         try:
-            req = urllib.request.Request(url)
+            # A fresh Request per call: urlopen mutates it while sending, so
+            # sharing one between calls or threads is unsafe
+            req = Request(url, headers={**REQUEST_HEADERS, **(headers or {})})
 
-            if headers:
-                for key, value in headers.items():
-                    req.add_header(key, value)
-
-            with urllib.request.urlopen(req) as response:
-                return response.read()
+            with urlopen(req, timeout=self.timeout) as response:
+                return self._decode_body(
+                    response.read(), response.getheader("Content-Encoding")
+                )
 
         except urllib.error.HTTPError as e:
             self.logger.error(f"HTTP Error {e.code} for {url}: {e.reason}")
@@ -104,6 +501,19 @@ class HTTPClient:
             self.logger.error(f"Error making request to {url}: {e}")
             return None
 
+    @staticmethod
+    def _decode_body(body: bytes, encoding: Optional[str]) -> bytes:
+        """Undo a gzip or deflate Content-Encoding applied by the server."""
+        if encoding == "gzip":
+            return gzip.decompress(body)
+        if encoding == "deflate":
+            try:
+                return zlib.decompress(body)
+            except zlib.error:
+                # Some servers send raw deflate data without the zlib wrapper
+                return zlib.decompress(body, -zlib.MAX_WBITS)
+        return body
+
 
 def download_file_with_progress(
     url: str, destination: Union[str, Path], description: str = "Downloading"
@@ -123,10 +533,118 @@ def download_file_with_progress(
     return client.download_with_retry(url, destination)
 
 
-def is_url_accessible(url: str) -> bool:
+def is_url_accessible(url: str, timeout: float = 5.0) -> bool:
     """Check if a URL is accessible."""
-    try:
-        urllib.request.urlopen(url)
+    return _get_default_client().is_accessible(url, timeout)
+
+
+# Shared client for the module-level helpers, created on first use
+_default_client: Optional[HTTPClient] = None
+_default_client_lock = threading.Lock()
+
+
+def _get_default_client() -> HTTPClient:
+    """Return the process-wide HTTPClient used by convenience functions."""
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = HTTPClient()
+    return _default_client
+
+
+# Circuit breaker state per host: (consecutive failures, time of the last,
+# whether a half-open probe is in flight)
+_breaker: Dict[str, Tuple[int, float, bool]] = {}
+_breaker_lock = threading.Lock()
+
+
+def _circuit_allows(host: str) -> bool:
+    """Return True if a download from host may go ahead.
+
+    While the circuit is open this is False. Once BREAKER_WINDOW has passed
+    it is True for exactly one caller, the probe, until its result is
+    recorded with _record_host_result.
+    """
+    if host not in _breaker:
+        return True
+    with _breaker_lock:
+        entry = _breaker.get(host)
+        if entry is None:
+            return True
+        failures, last_failure, probing = entry
+        if failures < BREAKER_THRESHOLD:
+            return True
+        if probing or time.monotonic() - last_failure < BREAKER_WINDOW:
+            return False
+        _breaker[host] = (failures, last_failure, True)
         return True
-    except:
-        return False
+
+
+def _record_host_result(host: str, failed: Optional[bool]) -> None:
+    """Record a finished download_with_retry call against host.
+
+    failed is True when the host looked down, False when it answered, and
+    None when the call says nothing about the host; that only ends a probe.
+    """
+    if failed is False:
+        if host in _breaker:
+            with _breaker_lock:
+                _breaker.pop(host, None)
+        return
+
+    now = time.monotonic()
+    with _breaker_lock:
+        entry = _breaker.get(host)
+        if failed is None:
+            if entry is not None:
+                _breaker[host] = (entry[0], entry[1], False)
+            return
+        failures, last_failure, _ = entry or (0, now, False)
+        # A failed half-open probe reopens the circuit straight away;
+        # otherwise only failures close together count as consecutive
+        if failures < BREAKER_THRESHOLD and now - last_failure >= BREAKER_WINDOW:
+            failures = 0
+        _breaker[host] = (failures + 1, now, False)
+
+
+# Resolver results cached by _cached_getaddrinfo, keyed on its arguments
+# in expiry order
+_dns_cache: "OrderedDict[tuple, Tuple[float, list]]" = OrderedDict()
+_dns_cache_lock = threading.Lock()
+_system_getaddrinfo = socket.getaddrinfo
+
+
+def _cached_getaddrinfo(host, port, family=0, type=0, proto=0, flags=0):
+    """socket.getaddrinfo that reuses results for DNS_CACHE_TTL seconds."""
+    key = (host, port, family, type, proto, flags)
+    now = time.monotonic()
+    entry = _dns_cache.get(key)
+    if entry is not None and entry[0] > now:
+        return list(entry[1])
+
+    result = _system_getaddrinfo(host, port, family, type, proto, flags)
+    with _dns_cache_lock:
+        # Re-inserting moves the key to the end, keeping expiry order, so
+        # expired entries and the oldest beyond the size cap sit up front
+        _dns_cache.pop(key, None)
+        _dns_cache[key] = (now + DNS_CACHE_TTL, result)
+        while len(_dns_cache) > DNS_CACHE_SIZE or (
+            next(iter(_dns_cache.values()))[0] <= now
+        ):
+            _dns_cache.popitem(last=False)
+    return list(result)
+
+
+def _install_dns_cache() -> None:
+    """Route socket.getaddrinfo through the process-wide DNS cache.
+
+    Downloads that hit the same host repeatedly otherwise resolve it on
+    every connection. This is opt-in since it affects all sockets in the
+    process, not just PyGit's, and ignores DNS record TTLs.
+    """
+    socket.getaddrinfo = _cached_getaddrinfo
+
+
+if os.environ.get("PYGIT_DNS_CACHE") == "1":
+    _install_dns_cache()
@@ -63,6 +63,10 @@ class MockHTTPResponse:
             return self._data
         return self._buffer.read(amt)
 
+    def readinto(self, buffer) -> int:
+        """Read response data into a preallocated buffer."""
+        return self._buffer.readinto(buffer)
+
     def readline(self) -> bytes:
         """Read a line from response."""
         return self._buffer.readline()
@@ -169,7 +173,7 @@ class HTTPMockRouter:
             response = MockHTTPResponse(response, status=status)
         self.default_response = response
 
-    def __call__(self, request) -> MockHTTPResponse:
+    def __call__(self, request, timeout=None) -> MockHTTPResponse:
         """Handle a mock request."""
         url = request.full_url if hasattr(request, "full_url") else str(request)
         self.call_history.append(url)
@@ -196,9 +200,9 @@ class HTTPMockRouter:
 _mock_router = HTTPMockRouter()
 
 
-def mock_urlopen(request):
+def mock_urlopen(request, timeout=None):
     """Drop-in replacement for urllib.request.urlopen."""
-    return _mock_router(request)
+    return _mock_router(request, timeout)
 
 
 @contextmanager
@@ -216,7 +220,9 @@ def mock_http(router: Optional[HTTPMockRouter] = None):
     if router is None:
         router = HTTPMockRouter()
 
-    with patch("urllib.request.urlopen", router):
+    # pygit.utils.http binds urlopen at import time, so patch it there too
+    with patch("urllib.request.urlopen", router), \
+            patch("pygit.utils.http.urlopen", router):
         yield router
 
 
@@ -235,5 +241,7 @@ def mock_http_responses(responses: Dict[str, Union[Dict, bytes, MockHTTPResponse
     for pattern, response in responses.items():
         router.add_route(pattern, response)
 
-    with patch("urllib.request.urlopen", router):
+    # pygit.utils.http binds urlopen at import time, so patch it there too
+    with patch("urllib.request.urlopen", router), \
+            patch("pygit.utils.http.urlopen", router):
         yield router
@@ -60,6 +60,42 @@ class TestGitIgnorePattern:
         assert pattern.matches("file1.txt")
         assert pattern.matches("fileA.txt")
 
+    @pytest.mark.unit
+    def test_single_asterisk_stays_in_component(self):
+        """Test that * does not match across directory separators."""
+        pattern = GitIgnorePattern("foo*bar")
+        assert pattern.matches("foobazbar")
+        assert pattern.matches("src/foo_bar")
+        assert not pattern.matches("foo/x/bar")
+
+    @pytest.mark.unit
+    def test_double_asterisk_any_depth(self):
+        """Test that a leading **/ matches at any depth, including the root."""
+        pattern = GitIgnorePattern("**/logs")
+        assert pattern.matches("logs")
+        assert pattern.matches("a/b/c/logs")
+
+    @pytest.mark.unit
+    def test_character_class_ranges(self):
+        """Test bracket expressions with ranges and negation."""
+        ranged = GitIgnorePattern("file[0-9].txt")
+        assert ranged.matches("file7.txt")
+        assert not ranged.matches("file-.txt")
+
+        negated = GitIgnorePattern("*.py[!c]")
+        assert negated.matches("module.pyo")
+        assert not negated.matches("module.pyc")
+
+    @pytest.mark.unit
+    def test_pattern_ignore_case(self):
+        """Test case folding is only applied when requested."""
+        folded = GitIgnorePattern("*.txt", ignore_case=True)
+        exact = GitIgnorePattern("*.txt", ignore_case=False)
+
+        assert folded.matches("README.TXT")
+        assert not exact.matches("README.TXT")
+        assert exact.matches("readme.txt")
+
     @pytest.mark.unit
     def test_pattern_str(self):
         """Test string representation."""
@@ -92,6 +128,17 @@ class TestGitIgnore:
         gitignore = GitIgnore(temp_repo_dir)
         assert gitignore.repository_root == temp_repo_dir
 
+    @pytest.mark.unit
+    def test_gitignore_detects_case_sensitivity(self, temp_repo_dir):
+        """Test case sensitivity is probed from the repository filesystem."""
+        gitignore = GitIgnore(temp_repo_dir)
+
+        probe = temp_repo_dir / "Case_Probe"
+        probe.touch()
+        expected = (temp_repo_dir / "cASE_pROBE").exists()
+
+        assert gitignore.ignore_case is expected
+
     @pytest.mark.unit
     def test_is_ignored_with_gitignore_file(self, temp_repo_dir):
         """Test is_ignored with .gitignore file."""
@@ -154,6 +201,27 @@ class TestGitIgnore:
         assert len(filtered) == 1
         assert filtered[0].name == "main.py"
 
+    @pytest.mark.unit
+    def test_walk_prunes_ignored_directories(self, temp_repo_dir):
+        """Test walk skips ignored files and never descends ignored dirs."""
+        gitignore_file = temp_repo_dir / ".gitignore"
+        gitignore_file.write_text("*.log\nnode_modules/\n")
+
+        (temp_repo_dir / "src").mkdir()
+        (temp_repo_dir / "src" / "main.py").touch()
+        (temp_repo_dir / "debug.log").touch()
+        (temp_repo_dir / "node_modules" / "pkg").mkdir(parents=True)
+        (temp_repo_dir / "node_modules" / "pkg" / "index.js").touch()
+        (temp_repo_dir / ".git").mkdir()
+        (temp_repo_dir / ".git" / "HEAD").touch()
+
+        gitignore = GitIgnore(temp_repo_dir)
+        walked = {
+            p.relative_to(temp_repo_dir).as_posix() for p in gitignore.walk()
+        }
+
+        assert walked == {".gitignore", "src/main.py"}
+
     @pytest.mark.unit
     def test_get_ignored_files(self, temp_repo_dir):
         """Test getting list of ignored files."""
@@ -262,6 +330,27 @@ build/
         assert not gitignore.is_ignored("README.md")
         assert not gitignore.is_ignored("requirements.txt")
 
+    @pytest.mark.unit
+    def test_specialized_matcher_agrees(self, temp_repo_dir):
+        """Test the combined matcher agrees with the sequential scan."""
+        gitignore_file = temp_repo_dir / ".gitignore"
+        gitignore_file.write_text("__pycache__/\n*.py[cod]\nvenv/\n/dist\n.env\n")
+
+        gitignore = GitIgnore(temp_repo_dir)
+
+        for path, is_dir in [
+            ("src/__pycache__", True),
+            ("src/__pycache__", False),
+            ("pkg/module.pyc", False),
+            ("pkg/module.py", False),
+            ("venv", True),
+            ("dist/app.whl", False),
+            ("src/dist", True),
+            (".env", False),
+        ]:
+            expected = gitignore._is_ignored_sequential(path, is_dir)
+            assert gitignore.is_ignored(path, is_dir) is expected, path
+
     @pytest.mark.unit
     def test_comments_and_blanks(self, temp_repo_dir):
         """Test that comments and blank lines are handled."""
@@ -281,6 +370,18 @@ build/
         assert gitignore.is_ignored("test.tmp")
         assert not gitignore.is_ignored("# This is a comment")
 
+    @pytest.mark.unit
+    def test_invalid_pattern_skipped(self, temp_repo_dir):
+        """Test that an invalid pattern does not stop the rest loading."""
+        gitignore_file = temp_repo_dir / ".gitignore"
+        gitignore_file.write_text("*.log\n[z-a]\n*.tmp\n")
+
+        gitignore = GitIgnore(temp_repo_dir)
+
+        assert len(gitignore.patterns) == 2
+        assert gitignore.is_ignored("test.log")
+        assert gitignore.is_ignored("test.tmp")
+
     @pytest.mark.unit
     def test_subdirectory_patterns(self, temp_repo_dir):
         """Test patterns for subdirectories."""
@@ -323,3 +424,75 @@ build/
         # Path outside repo should not be affected
         outside_path = "/some/other/path/file.txt"
         assert not gitignore.is_ignored(outside_path)
+
+
+class TestGitIgnoreHyperscan:
+    """Tests for the optional Hyperscan matcher on large pattern sets."""
+
+    PATTERNS = [f"*.ext{i}" for i in range(40)] + [
+        "*.log",
+        "!keep.log",
+        "build/",
+        "/root_only.txt",
+        "file?.txt",
+    ]
+
+    PATHS = [
+        ("a.ext7", False),
+        ("deep/dir/b.ext39", False),
+        ("debug.log", False),
+        ("keep.log", False),
+        ("build", True),
+        ("build", False),
+        ("root_only.txt", False),
+        ("sub/root_only.txt", False),
+        ("file1.txt", False),
+        ("main.py", False),
+    ]
+
+    def _make_gitignore(self, temp_repo_dir):
+        gitignore_file = temp_repo_dir / ".gitignore"
+        gitignore_file.write_text("\n".join(self.PATTERNS) + "\n")
+        return GitIgnore(temp_repo_dir)
+
+    @staticmethod
+    def _sequential(gitignore, path, is_dir):
+        ignored = False
+        for pattern in gitignore.patterns:
+            if pattern.matches(path, is_dir):
+                ignored = not pattern.negated
+        return ignored
+
+    @pytest.mark.unit
+    def test_hyperscan_matches_sequential(self, temp_repo_dir):
+        """Test the Hyperscan database agrees with pattern-by-pattern matching."""
+        pytest.importorskip("hyperscan")
+        gitignore = self._make_gitignore(temp_repo_dir)
+
+        for path, is_dir in self.PATHS:
+            expected = self._sequential(gitignore, path, is_dir)
+            assert gitignore.is_ignored(path, is_dir) is expected, path
+
+        assert gitignore._hs_db is not None
+
+    @pytest.mark.unit
+    def test_fallback_without_hyperscan(self, temp_repo_dir, monkeypatch):
+        """Test matching falls back to the regex scan without Hyperscan."""
+        monkeypatch.setattr("pygit.core.ignore.hyperscan", None)
+        gitignore = self._make_gitignore(temp_repo_dir)
+
+        for path, is_dir in self.PATHS:
+            expected = self._sequential(gitignore, path, is_dir)
+            assert gitignore.is_ignored(path, is_dir) is expected, path
+
+        assert gitignore._hs_db is None
+
+    @pytest.mark.unit
+    def test_add_pattern_invalidates_database(self, temp_repo_dir):
+        """Test that adding a pattern rebuilds the compiled matcher."""
+        pytest.importorskip("hyperscan")
+        gitignore = self._make_gitignore(temp_repo_dir)
+
+        assert not gitignore.is_ignored("notes.md")
+        gitignore.add_pattern("*.md")
+        assert gitignore.is_ignored("notes.md")
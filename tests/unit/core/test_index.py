@@ -7,6 +7,7 @@ add/remove operations, and corruption recovery.
 
 import os
 import struct
+import hashlib
 import tempfile
 import shutil
 from pathlib import Path
@@ -101,6 +102,13 @@ class TestIndexEntry:
         entry = IndexEntry(long_path, "0" * 40)
         assert entry.flags <= 0xFFFF
 
+    @pytest.mark.unit
+    def test_index_entry_flags_name_length(self):
+        """Test that flags hold the UTF-8 name length capped at 12 bits."""
+        assert IndexEntry("a.txt", "0" * 40).flags == 5
+        assert IndexEntry("\u00e9.txt", "0" * 40).flags == 6
+        assert IndexEntry("a" * 5000, "0" * 40).flags == 0xFFF
+
     @pytest.mark.unit
     def test_index_entry_timestamp_overflow(self, temp_dir):
         """Test handling of large timestamps."""
@@ -259,6 +267,20 @@ class TestIndex:
         entry_count = struct.unpack(">I", data[8:12])[0]
         assert entry_count == 1
 
+    @pytest.mark.unit
+    def test_index_file_checksum(self, repo_with_files, temp_repo_dir):
+        """Test that the saved index ends with a SHA-1 of its contents."""
+        index = Index(repo_with_files)
+        index.add("README.md", temp_repo_dir)
+        index.add("main.py", temp_repo_dir)
+        index.save()
+
+        data = (repo_with_files.git_dir / "index").read_bytes()
+        entries_size = sum(e.packed_size() for e in index.list_entries())
+
+        assert len(data) == 12 + entries_size + 20
+        assert data[-20:] == hashlib.sha1(data[:-20]).digest()
+
     @pytest.mark.unit
     def test_index_contains_operator(self, repo_with_file, temp_repo_dir):
         """Test __contains__ operator."""
@@ -352,6 +374,19 @@ class TestIndexModifiedFiles:
         assert "test.txt" in modified
         assert modified["test.txt"] == "deleted"
 
+    @pytest.mark.unit
+    def test_get_modified_parent_replaced_by_file(self, repo_with_files, temp_repo_dir):
+        """Test a file whose parent directory became a file is deleted."""
+        index = Index(repo_with_files)
+        index.add("src/module.py", temp_repo_dir)
+
+        # Replace the src directory with a regular file
+        shutil.rmtree(temp_repo_dir / "src")
+        (temp_repo_dir / "src").write_text("not a directory\n")
+
+        modified = index.get_modified_files(temp_repo_dir)
+        assert modified == {"src/module.py": "deleted"}
+
     @pytest.mark.unit
     def test_get_modified_changed_content(self, repo_with_file, temp_repo_dir):
         """Test detecting modified files."""
@@ -366,6 +401,27 @@ class TestIndexModifiedFiles:
         assert "test.txt" in modified
         assert modified["test.txt"] == "modified"
 
+    @pytest.mark.unit
+    def test_get_modified_unchanged_file(self, repo_with_file, temp_repo_dir):
+        """Test that an untouched file is not reported."""
+        index = Index(repo_with_file)
+        index.add("test.txt", temp_repo_dir)
+
+        assert index.get_modified_files(temp_repo_dir) == {}
+
+    @pytest.mark.unit
+    def test_get_modified_after_remove(self, repo_with_files, temp_repo_dir):
+        """Test that removed entries are no longer scanned."""
+        index = Index(repo_with_files)
+        index.add("README.md", temp_repo_dir)
+        index.add("main.py", temp_repo_dir)
+        index.get_modified_files(temp_repo_dir)
+
+        index.remove("main.py")
+        (temp_repo_dir / "main.py").unlink()
+
+        assert index.get_modified_files(temp_repo_dir) == {}
+
     @pytest.mark.unit
     def test_get_modified_no_changes(self, repo_with_file, temp_repo_dir):
         """Test when no files are modified."""
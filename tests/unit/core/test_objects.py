@@ -66,6 +66,22 @@ class TestBlob:
         assert decompressed.startswith(b"blob ")
         assert b"\0" in decompressed
 
+    @pytest.mark.unit
+    def test_blob_pack(self):
+        """Test pack returns the header-prefixed payload that is hashed."""
+        blob = Blob(b"hello")
+
+        assert blob.pack() == b"blob 5\0hello"
+        assert hashlib.sha1(blob.pack()).hexdigest() == blob.sha1()
+
+    @pytest.mark.unit
+    def test_blob_pack_and_hash(self):
+        """Test pack_and_hash hashes the packed buffer it returns."""
+        packed, sha1 = Blob(b"hello").pack_and_hash()
+
+        assert packed == b"blob 5\0hello"
+        assert sha1 == Blob(b"hello").sha1()
+
     @pytest.mark.unit
     def test_blob_equality(self):
         """Test blob equality based on SHA1."""
@@ -105,6 +121,25 @@ class TestTreeEntry:
         # Should end with 20 raw bytes (SHA1 in binary)
         assert len(serialized) == len(b"100644 test.txt\0") + 20
 
+    @pytest.mark.unit
+    def test_tree_entry_accepts_raw_sha1(self):
+        """Test entries built from raw bytes expose the same hex SHA-1."""
+        raw = bytes(range(20))
+        from_raw = TreeEntry("100644", "file.txt", raw)
+        from_hex = TreeEntry("100644", "file.txt", raw.hex())
+
+        assert from_raw.sha1 == raw.hex()
+        assert from_raw.serialize() == from_hex.serialize()
+        assert from_raw.serialize().endswith(raw)
+
+    @pytest.mark.unit
+    def test_tree_entry_serialize_after_update(self, sample_tree_entry):
+        """Test assigning entry fields refreshes the precomputed bytes."""
+        sample_tree_entry.name = "renamed.txt"
+        sample_tree_entry.sha1 = "f" * 40
+
+        assert sample_tree_entry.serialize() == b"100644 renamed.txt\0" + b"\xff" * 20
+
 
 class TestTree:
     """Tests for Tree object."""
@@ -165,6 +200,31 @@ class TestTree:
         assert data.find(b"apple.txt") < data.find(b"mango.txt")
         assert data.find(b"mango.txt") < data.find(b"zebra.txt")
 
+    @pytest.mark.unit
+    def test_tree_entries_sorted_directories_with_trailing_slash(self):
+        """Test directories sort as if their name ended with '/' like Git."""
+        tree = Tree()
+        tree.add_entry("040000", "foo", "a" * 40)
+        tree.add_entry("100644", "foo.txt", "b" * 40)
+        tree.add_entry("100644", "foo-bar", "c" * 40)
+
+        data = tree.data
+        # '-' (0x2d) < '.' (0x2e) < '/' (0x2f)
+        assert data.find(b"foo-bar") < data.find(b"foo.txt")
+        assert data.find(b"foo.txt") < data.find(b"40000 foo\0")
+
+    @pytest.mark.unit
+    def test_tree_data_matches_entry_serialization(self):
+        """Test tree data is the concatenation of its serialized entries."""
+        tree = Tree()
+        tree.add_entry("100644", "b.txt", "b" * 40)
+        tree.add_entry("040000", "a", "a" * 40)
+        tree.add_entry("100755", "c.sh", "c" * 40)
+
+        ordered = sorted(tree.entries, key=lambda e: e._sort_key)
+        expected = b"".join(entry.serialize() for entry in ordered)
+        assert tree.data == expected
+
 
 class TestAuthor:
     """Tests for Author."""
@@ -183,6 +243,16 @@ class TestAuthor:
         serialized = sample_author.serialize()
         assert serialized == "Test User <test@example.com> 1704067200 -0600"
 
+    @pytest.mark.unit
+    def test_author_serialize_after_update(self, sample_author):
+        """Test changing a field refreshes the cached serialization."""
+        sample_author.serialize()
+        sample_author.name = "Renamed User"
+
+        assert sample_author.serialize() == (
+            "Renamed User <test@example.com> 1704067200 -0600"
+        )
+
     @pytest.mark.unit
     def test_author_default_timestamp(self):
         """Test author with default timestamp."""
@@ -237,6 +307,17 @@ class TestCommit:
         assert sha1_before != sha1_after
         assert len(sample_commit.parents) == 1
 
+    @pytest.mark.unit
+    def test_commit_sha1_changes_on_assignment(self, sample_commit):
+        """Test assigning a field invalidates the cached hash."""
+        sha1_before = sample_commit.sha1()
+        assert sample_commit.sha1() is sample_commit.sha1()
+
+        sample_commit.message = "Amended message"
+
+        assert sample_commit.sha1() != sha1_before
+        assert sample_commit.data.decode().endswith("Amended message")
+
 
 class TestTag:
     """Tests for Tag object."""
@@ -141,6 +141,7 @@ class TestRepositoryObjectStorage:
 
         assert obj_path.parent.name == "ab"  # First 2 chars
         assert obj_path.name == "c123def456789012345678901234567890abcd"
+        assert obj_path.parent == empty_repo.git_dir / "objects" / "ab"
 
     @pytest.mark.unit
     def test_object_path_invalid_sha1(self, empty_repo):
@@ -150,6 +151,13 @@ class TestRepositoryObjectStorage:
 
         assert "Invalid SHA-1" in str(exc_info.value)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("sha1", ["g" * 40, "ab " * 13 + "a", "ab" * 21])
+    def test_object_path_rejects_non_hex(self, empty_repo, sha1):
+        """Test 40-character strings that are not hex digests are rejected."""
+        with pytest.raises(ValueError, match="Invalid SHA-1"):
+            empty_repo.object_path(sha1)
+
     @pytest.mark.unit
     def test_store_blob_object(self, empty_repo, sample_blob):
         """Test storing a blob object."""
@@ -194,6 +202,19 @@ class TestRepositoryObjectStorage:
         obj_path = empty_repo.object_path(sha1)
         assert obj_path.exists()
 
+    @pytest.mark.unit
+    def test_store_objects_bulk(self, empty_repo, sample_blob, sample_tree):
+        """Test storing several objects at once."""
+        blobs = [Blob(f"content {i}\n".encode()) for i in range(5)]
+        objects = blobs + [sample_blob, sample_tree, sample_blob]
+
+        sha1s = empty_repo.store_objects(objects)
+
+        assert sha1s == [obj.sha1() for obj in objects]
+        for sha1 in sha1s:
+            assert empty_repo.object_path(sha1).exists()
+        assert empty_repo.get_object(sha1s[0]).content == b"content 0\n"
+
     @pytest.mark.unit
     def test_stored_object_is_compressed(self, empty_repo, sample_blob):
         """Test that stored objects are zlib compressed."""
@@ -206,6 +227,73 @@ class TestRepositoryObjectStorage:
         assert b"blob" in decompressed
         assert sample_blob.content in decompressed
 
+    @pytest.mark.unit
+    def test_stored_object_uses_fastest_level(self, empty_repo, monkeypatch):
+        """Test loose objects are compressed at Git's default level 1."""
+        monkeypatch.setattr(Repository, "use_libdeflate", False)
+        sha1 = empty_repo.store_object(Blob(b"fast\n" * 100))
+
+        # The zlib header's FLEVEL bits are 0 for the fastest levels
+        assert empty_repo.object_path(sha1).read_bytes()[:2] == b"\x78\x01"
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_libdeflate", [True, False])
+    def test_compressor_round_trip(self, empty_repo, monkeypatch, use_libdeflate):
+        """Test objects round-trip with and without libdeflate."""
+        monkeypatch.setattr(Repository, "use_libdeflate", use_libdeflate)
+        blob = Blob(b"compressed either way\n" * 50)
+
+        sha1 = empty_repo.store_object(blob)
+        raw = zlib.decompress(empty_repo.object_path(sha1).read_bytes())
+
+        assert raw == f"blob {len(blob.content)}\0".encode() + blob.content
+        assert empty_repo.get_object(sha1).content == blob.content
+
+    @pytest.mark.unit
+    def test_store_object_recreates_removed_fanout_dir(self, empty_repo):
+        """Test a fan-out directory removed after first use is recreated."""
+        first = Blob(b"first")
+        obj_path = empty_repo.object_path(empty_repo.store_object(first))
+        obj_path.unlink()
+        obj_path.parent.rmdir()
+
+        # Same fan-out directory, already marked as created
+        assert empty_repo.store_object(first) == first.sha1()
+        assert obj_path.exists()
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(
+        not hasattr(os, "O_TMPFILE") or not os.path.isdir("/proc/self/fd"),
+        reason="O_TMPFILE and /proc are Linux-only",
+    )
+    def test_store_object_links_o_tmpfile(self, empty_repo, monkeypatch):
+        """Test the O_TMPFILE path links the object without the fallback."""
+        import tempfile
+
+        def no_mkstemp(*args, **kwargs):
+            raise AssertionError("fell back to mkstemp")
+
+        monkeypatch.setattr(tempfile, "mkstemp", no_mkstemp)
+        blob = Blob(b"linked from an anonymous file\n")
+
+        sha1 = empty_repo.store_object(blob)
+        obj_path = empty_repo.object_path(sha1)
+
+        assert os.listdir(obj_path.parent) == [obj_path.name]
+        assert empty_repo.get_object(sha1).content == blob.content
+
+    @pytest.mark.unit
+    def test_store_object_without_o_tmpfile(self, empty_repo, monkeypatch):
+        """Test the rename fallback writes the object and leaves no temp file."""
+        monkeypatch.delattr(os, "O_TMPFILE", raising=False)
+        blob = Blob(b"written via rename\n")
+
+        sha1 = empty_repo.store_object(blob)
+        obj_path = empty_repo.object_path(sha1)
+
+        assert os.listdir(obj_path.parent) == [obj_path.name]
+        assert empty_repo.get_object(sha1).content == blob.content
+
 
 class TestRepositoryObjectRetrieval:
     """Tests for retrieving objects."""
@@ -290,6 +378,46 @@ class TestRepositoryObjectRetrieval:
         result = empty_repo.get_object(fake_sha)
         assert result is None
 
+    @pytest.mark.unit
+    def test_get_object_cached(self, empty_repo, monkeypatch):
+        """Test repeated reads are served from the bounded object cache."""
+        monkeypatch.setattr(Repository, "OBJECT_CACHE_SIZE", 2)
+        blob_sha = empty_repo.store_object(Blob(b"content"))
+        sha1s = [
+            empty_repo.store_object(Tree([TreeEntry("100644", f"f{i}", blob_sha)]))
+            for i in range(3)
+        ]
+
+        first = empty_repo.get_object(sha1s[0])
+        assert empty_repo.get_object(sha1s[0]) is first
+
+        empty_repo.get_object(sha1s[1])
+        empty_repo.get_object(sha1s[2])
+
+        assert list(empty_repo._obj_cache) == sha1s[1:]
+        assert empty_repo.get_object(sha1s[0]) is not first
+
+    @pytest.mark.unit
+    def test_get_object_does_not_cache_blobs(self, empty_repo):
+        """Test blob contents are not pinned in the object cache."""
+        sha1 = empty_repo.store_object(Blob(b"large file contents\n"))
+
+        first = empty_repo.get_object(sha1)
+
+        assert sha1 not in empty_repo._obj_cache
+        assert empty_repo.get_object(sha1) is not first
+
+    @pytest.mark.unit
+    def test_get_objects_preserves_order(self, empty_repo):
+        """Test bulk retrieval returns objects in request order."""
+        sha1s = [empty_repo.store_object(Blob(b"blob %d" % i)) for i in range(20)]
+        requested = sha1s[::-1] + ["0" * 40]
+
+        objects = empty_repo.get_objects(requested)
+
+        assert [obj.sha1() for obj in objects[:-1]] == requested[:-1]
+        assert objects[-1] is None
+
 
 class TestRepositoryHead:
     """Tests for HEAD management."""
@@ -354,6 +482,16 @@ class TestRepositoryParseObjects:
         # Should handle gracefully
         assert author is not None
 
+    @pytest.mark.unit
+    def test_parse_author_irregular_spacing(self, empty_repo):
+        """Test extra whitespace around name and email is stripped."""
+        author_str = "John Doe  < john@example.com > 1704067200 +0000"
+        author = empty_repo._parse_author(author_str)
+
+        assert author.name == "John Doe"
+        assert author.email == "john@example.com"
+        assert author.timestamp == 1704067200
+
     @pytest.mark.unit
     def test_parse_tree_multiple_entries(self, empty_repo):
         """Test parsing tree with multiple entries."""
@@ -369,6 +507,30 @@ class TestRepositoryParseObjects:
 
         assert len(tree.entries) == 3
 
+    @pytest.mark.unit
+    def test_parse_tree_round_trip(self, empty_repo):
+        """Test parsed trees reserialize to the same bytes."""
+        tree = Tree()
+        tree.add_entry("100644", "name with spaces.txt", "a" * 40)
+        tree.add_entry("40000", "dir", "b" * 40)
+
+        parsed = empty_repo._parse_tree(tree.data)
+
+        assert [e.name for e in parsed.entries] == ["dir", "name with spaces.txt"]
+        assert parsed.entries[1].sha1 == "a" * 40
+        assert parsed.data == tree.data
+
+    @pytest.mark.unit
+    def test_parse_tree_zero_padded_mode(self, empty_repo):
+        """Test non-canonical zero-padded modes are normalized when parsed."""
+        tree_data = b"040000 dir\0" + b"\0" * 20 + b"100644 dir.txt\0" + b" " * 20
+
+        parsed = empty_repo._parse_tree(tree_data)
+
+        assert [e.name for e in parsed.entries] == ["dir", "dir.txt"]
+        assert parsed.entries[0].serialize() == b"40000 dir\0" + b"\0" * 20
+        assert parsed.entries[1].sha1 == "20" * 20
+
     @pytest.mark.unit
     def test_parse_commit_with_parents(self, empty_repo):
         """Test parsing commit with parent commits."""
@@ -386,3 +548,23 @@ Merge commit message"""
         assert len(commit.parents) == 2
         assert commit.parents[0] == "b" * 40
         assert commit.parents[1] == "c" * 40
+
+    @pytest.mark.unit
+    def test_parse_commit_round_trip(self, empty_repo):
+        """Test parsed commits keep committer and multi-paragraph messages."""
+        author = Author("Author", "author@test.com", 1704067200, "+0100")
+        committer = Author("Committer", "committer@test.com", 1704070800, "-0500")
+        commit = Commit(
+            tree_sha1="a" * 40,
+            parents=["b" * 40],
+            author=author,
+            committer=committer,
+            message="Subject\n\nBody paragraph\n\nTrailer: value",
+        )
+
+        parsed = empty_repo._parse_commit(commit.data)
+
+        assert parsed.committer.name == "Committer"
+        assert parsed.committer.email == "committer@test.com"
+        assert parsed.message == "Subject\n\nBody paragraph\n\nTrailer: value"
+        assert parsed.sha1() == commit.sha1()
@@ -5,15 +5,53 @@ Tests for HTTPClient class including download, retry logic,
 and request handling.
 """
 
+import gzip
+import random
+import threading
+import urllib.error
+import zlib
+from collections import OrderedDict
+from io import BytesIO
 from pathlib import Path
 from unittest.mock import patch, MagicMock
-from io import BytesIO
 
 import pytest
 
 from pygit.utils.http import HTTPClient, download_file_with_progress, is_url_accessible
 
 
+class FakeResponse(BytesIO):
+    """Minimal stand-in for an HTTP response object."""
+
+    def __init__(self, body=b"", headers=None, status=200, error=None):
+        super().__init__(body)
+        self._headers = headers or {}
+        self.status = status
+        self._error = error
+
+    def getheader(self, name, default=None):
+        return self._headers.get(name, default)
+
+    def readinto(self, buffer):
+        n = super().readinto(buffer)
+        if not n and self._error is not None:
+            raise self._error
+        return n
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breaker(monkeypatch):
+    """Keep failures recorded by one test from opening circuits in another."""
+    import pygit.utils.http as http_module
+    monkeypatch.setattr(http_module, "_breaker", {})
+
+
 class TestHTTPClient:
     """Tests for HTTPClient class."""
 
@@ -30,6 +68,30 @@ class TestHTTPClient:
         client = HTTPClient(progress_callback=callback)
         assert client.progress_callback == callback
 
+    @pytest.mark.unit
+    def test_client_context_manager_closes(self):
+        """Test leaving the with-block closes the client."""
+        with patch.object(HTTPClient, "close") as mock_close:
+            with HTTPClient() as client:
+                assert isinstance(client, HTTPClient)
+            mock_close.assert_called_once_with()
+
+    @pytest.mark.unit
+    def test_download_uses_timeout(self, temp_dir):
+        """Test downloads pass the default timeout to urlopen."""
+        with patch("pygit.utils.http.urlopen", side_effect=OSError) as mock_open:
+            HTTPClient().download_file("https://example.com/f", temp_dir / "f")
+
+        assert mock_open.call_args.kwargs["timeout"] == 30.0
+
+    @pytest.mark.unit
+    def test_custom_timeout(self):
+        """Test a client-specific timeout reaches urlopen."""
+        with patch("pygit.utils.http.urlopen", side_effect=OSError) as mock_open:
+            HTTPClient(timeout=5).make_request("https://example.com/api")
+
+        assert mock_open.call_args.kwargs["timeout"] == 5
+
 
 class TestHTTPClientDownload:
     """Tests for download functionality."""
@@ -41,13 +103,9 @@ class TestHTTPClientDownload:
         dest_file = temp_dir / "downloaded.txt"
 
         # Mock the urlopen
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"test content", b""]
-        mock_response.getheader.return_value = None
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_response = FakeResponse(b"test content", {"Content-Length": "12"})
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
             result = client.download_file(
                 "https://example.com/file.txt",
                 dest_file
@@ -56,19 +114,53 @@ class TestHTTPClientDownload:
         assert result is True
         assert dest_file.exists()
 
+    @pytest.mark.unit
+    def test_download_file_larger_than_buffer(self, temp_dir):
+        """Test multi-chunk downloads are written completely and in order."""
+        client = HTTPClient()
+        dest_file = temp_dir / "large.bin"
+        body = bytes(range(256)) * 1024  # 256 KiB, several read buffers
+
+        mock_response = FakeResponse(body)
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            result = client.download_file("https://example.com/large.bin", dest_file)
+
+        assert result is True
+        assert dest_file.read_bytes() == body
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("content_length, expected", [("200", 200), (None, None)])
+    def test_download_preallocates_when_content_length(
+        self, temp_dir, content_length, expected
+    ):
+        """Test the file is preallocated only when the size is known."""
+        client = HTTPClient()
+        dest_file = temp_dir / "file.txt"
+
+        headers = {"Content-Length": content_length} if content_length else {}
+        mock_response = FakeResponse(b"a" * 200, headers)
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            with patch("os.posix_fallocate", create=True) as mock_fallocate:
+                result = client.download_file("https://example.com/f", dest_file)
+
+        assert result is True
+        assert dest_file.read_bytes() == b"a" * 200
+        if expected is None:
+            mock_fallocate.assert_not_called()
+        else:
+            assert mock_fallocate.call_args.args[1:] == (0, expected)
+
     @pytest.mark.unit
     def test_download_file_creates_dirs(self, temp_dir):
         """Test that download creates parent directories."""
         client = HTTPClient()
         dest_file = temp_dir / "subdir" / "nested" / "file.txt"
 
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"content", b""]
-        mock_response.getheader.return_value = None
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_response = FakeResponse(b"content")
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
             result = client.download_file(
                 "https://example.com/file.txt",
                 dest_file,
@@ -79,50 +171,37 @@ class TestHTTPClientDownload:
         assert dest_file.parent.exists()
 
     @pytest.mark.unit
-    def test_download_file_http_error(self, temp_dir):
-        """Test handling of HTTP errors."""
+    def test_download_file_existing_dir_skips_makedirs(self, temp_dir):
+        """Test an existing parent directory is not created again."""
         client = HTTPClient()
         dest_file = temp_dir / "file.txt"
 
-        import urllib.error
-        error = urllib.error.HTTPError(
-            "https://example.com/file.txt",
-            500,
-            "Server Error",
-            {},
-            None
-        )
-
-        with patch("urllib.request.urlopen", side_effect=error):
-            result = client.download_file(
-                "https://example.com/file.txt",
-                dest_file
-            )
+        with patch("pygit.utils.http.urlopen", return_value=FakeResponse(b"content")):
+            with patch("os.makedirs") as mock_makedirs:
+                result = client.download_file(
+                    "https://example.com/file.txt",
+                    dest_file,
+                    create_dirs=True
+                )
 
-        assert result is False
+        assert result is True
+        mock_makedirs.assert_not_called()
 
     @pytest.mark.unit
-    def test_download_file_404_silent(self, temp_dir):
-        """Test that 404 errors are handled silently."""
+    def test_download_file_error_leaves_no_partial(self, temp_dir):
+        """Test a mid-stream failure leaves neither a partial nor a .part file."""
         client = HTTPClient()
         dest_file = temp_dir / "file.txt"
-
-        import urllib.error
-        error = urllib.error.HTTPError(
-            "https://example.com/file.txt",
-            404,
-            "Not Found",
-            {},
-            None
+        mock_response = FakeResponse(
+            b"first chunk", error=IOError("connection reset")
         )
 
-        with patch("urllib.request.urlopen", side_effect=error):
-            result = client.download_file(
-                "https://example.com/file.txt",
-                dest_file
-            )
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            result = client.download_file("https://example.com/file.txt", dest_file)
 
         assert result is False
+        assert not dest_file.exists()
+        assert not (temp_dir / "file.txt.part").exists()
 
     @pytest.mark.unit
     def test_download_with_progress(self, temp_dir):
@@ -135,102 +214,506 @@ class TestHTTPClientDownload:
         client = HTTPClient(progress_callback=progress_callback)
         dest_file = temp_dir / "file.txt"
 
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"a" * 100, b"b" * 100, b""]
-        mock_response.getheader.return_value = "200"  # Content-Length
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_response = FakeResponse(
+            b"a" * 100 + b"b" * 100, {"Content-Length": "200"}
+        )
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
             client.download_file(
                 "https://example.com/file.txt",
                 dest_file
             )
 
-        # Progress should have been called
-        assert len(progress_calls) > 0
+        # Small downloads report once, on completion
+        assert progress_calls == [(200, 200)]
+
+    @pytest.mark.unit
+    def test_download_with_progress_throttled(self, temp_dir):
+        """Test progress is reported per 5 MiB rather than per chunk."""
+        progress_calls = []
+        client = HTTPClient(progress_callback=lambda d, t: progress_calls.append(d))
+        dest_file = temp_dir / "large.bin"
+        total = 20 * 1024 * 1024
+
+        mock_response = FakeResponse(b"x" * total, {"Content-Length": str(total)})
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            with patch("time.monotonic", return_value=0.0):
+                client.download_file("https://example.com/large.bin", dest_file)
+
+        mib = 1024 * 1024
+        assert progress_calls == [5 * mib, 10 * mib, 15 * mib, 20 * mib]
 
 
 class TestHTTPClientRetry:
     """Tests for retry functionality."""
 
     @pytest.mark.unit
-    def test_download_with_retry_success_first_try(self, temp_dir):
-        """Test retry succeeds on first attempt."""
+    @pytest.mark.parametrize("fail_count, max_retries, expected_result", [
+        (0, 3, True),   # succeeds on the first attempt
+        (2, 3, True),   # succeeds after two failures
+        (3, 3, False),  # exhausts every attempt
+    ])
+    def test_download_with_retry(
+        self, temp_dir, fail_count, max_retries, expected_result
+    ):
+        """Test retries continue until success or max_retries is reached."""
         client = HTTPClient()
         dest_file = temp_dir / "file.txt"
 
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"content", b""]
-        mock_response.getheader.return_value = None
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        import urllib.error
+        error = urllib.error.HTTPError("url", 500, "Error", {}, None)
+        responses = [error] * fail_count + [FakeResponse(b"content")]
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
-            result = client.download_with_retry(
-                "https://example.com/file.txt",
-                dest_file,
-                max_retries=3
-            )
+        with patch("pygit.utils.http.urlopen", side_effect=responses) as mock_open:
+            with patch("time.sleep"):  # Skip actual sleep
+                result = client.download_with_retry(
+                    "https://example.com/file.txt",
+                    dest_file,
+                    max_retries=max_retries
+                )
 
-        assert result is True
+        assert result is expected_result
+        assert mock_open.call_count == min(fail_count + 1, max_retries)
+        if expected_result:
+            assert dest_file.read_bytes() == b"content"
 
     @pytest.mark.unit
-    def test_download_with_retry_eventual_success(self, temp_dir):
-        """Test retry succeeds after initial failures."""
+    @pytest.mark.parametrize("method, code, expected_calls", [
+        ("download_with_retry", 404, 1),
+        ("download_with_retry", 500, 3),
+        ("download_with_retry", 502, 3),
+        ("download_with_retry", 401, 1),
+        ("download_file", 404, 1),
+        ("download_file", 500, 1),
+    ])
+    def test_download_error_behavior(self, temp_dir, method, code, expected_calls):
+        """Test HTTP errors fail the download; only retries repeat server errors."""
         client = HTTPClient()
         dest_file = temp_dir / "file.txt"
+        kwargs = {"max_retries": 3} if method == "download_with_retry" else {}
 
-        import urllib.error
+        error = urllib.error.HTTPError("url", code, "Error", {}, None)
 
-        # First two calls fail, third succeeds
-        mock_response = MagicMock()
-        mock_response.read.side_effect = [b"content", b""]
-        mock_response.getheader.return_value = None
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        with patch("pygit.utils.http.urlopen", side_effect=error) as mock_open:
+            with patch("time.sleep") as mock_sleep:
+                result = getattr(client, method)(
+                    "https://example.com/file.txt", dest_file, **kwargs
+                )
 
-        error = urllib.error.HTTPError(
-            "url", 500, "Error", {}, None
+        assert result is False
+        assert not dest_file.exists()
+        assert mock_open.call_count == expected_calls
+        assert mock_sleep.call_count == expected_calls - 1
+
+    @staticmethod
+    def _interrupted(body, headers):
+        """Return a response that fails after sending body."""
+        return FakeResponse(
+            body, headers, error=ConnectionResetError("connection reset")
         )
 
-        call_count = [0]
-        def mock_urlopen(url):
-            call_count[0] += 1
-            if call_count[0] < 3:
-                raise error
-            return mock_response
+    @pytest.mark.unit
+    @pytest.mark.parametrize("headers, if_range", [
+        ({"ETag": '"v1"'}, '"v1"'),
+        ({"ETag": 'W/"v1"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"},
+         "Wed, 01 Jan 2025 00:00:00 GMT"),
+    ])
+    def test_download_with_retry_resumes_with_range(self, temp_dir, headers, if_range):
+        """Test a retry requests only the bytes missing after a failure."""
+        client = HTTPClient()
+        dest_file = temp_dir / "file.bin"
+        body = bytes(range(250))
+
+        first = self._interrupted(body[:100], {"Content-Length": "250", **headers})
+        second = FakeResponse(
+            body[100:],
+            {"Content-Length": "150", "Content-Range": "bytes 100-249/250"},
+            status=206,
+        )
 
-        with patch("urllib.request.urlopen", side_effect=mock_urlopen):
-            with patch("time.sleep"):  # Skip actual sleep
+        with patch(
+            "pygit.utils.http.urlopen", side_effect=[first, second]
+        ) as mock_open:
+            with patch("time.sleep"):
                 result = client.download_with_retry(
-                    "https://example.com/file.txt",
-                    dest_file,
-                    max_retries=3
+                    "https://example.com/file.bin", dest_file, max_retries=2
                 )
 
         assert result is True
+        request = mock_open.call_args[0][0]
+        assert request.get_header("Range") == "bytes=100-"
+        assert request.get_header("If-range") == if_range
+        assert dest_file.read_bytes() == body
+        assert not (temp_dir / "file.bin.part").exists()
 
     @pytest.mark.unit
-    def test_download_with_retry_all_fail(self, temp_dir):
-        """Test retry exhausts all attempts."""
+    def test_download_with_retry_restarts_without_validator(self, temp_dir):
+        """Test partial data without an ETag or Last-Modified is not resumed."""
         client = HTTPClient()
-        dest_file = temp_dir / "file.txt"
+        dest_file = temp_dir / "file.bin"
+
+        first = self._interrupted(b"old", {"Content-Length": "10"})
+        second = FakeResponse(b"new body!!")
+
+        with patch(
+            "pygit.utils.http.urlopen", side_effect=[first, second]
+        ) as mock_open:
+            with patch("time.sleep"):
+                result = client.download_with_retry(
+                    "https://example.com/file.bin", dest_file, max_retries=2
+                )
+
+        assert result is True
+        assert mock_open.call_args[0][0] == "https://example.com/file.bin"
+        assert dest_file.read_bytes() == b"new body!!"
+
+    @pytest.mark.unit
+    def test_download_with_retry_restarts_on_wrong_content_range(self, temp_dir):
+        """Test a 206 for a different range than requested is not spliced in."""
+        client = HTTPClient()
+        dest_file = temp_dir / "file.bin"
+        body = bytes(range(250))
+
+        first = self._interrupted(body[:100], {"ETag": '"v1"'})
+        wrong_range = FakeResponse(
+            body, {"Content-Range": "bytes 0-249/250"}, status=206
+        )
+        full = FakeResponse(body)
+
+        with patch(
+            "pygit.utils.http.urlopen", side_effect=[first, wrong_range, full]
+        ) as mock_open:
+            with patch("time.sleep"):
+                result = client.download_with_retry(
+                    "https://example.com/file.bin", dest_file, max_retries=2
+                )
+
+        assert result is True
+        assert mock_open.call_count == 3
+        assert mock_open.call_args[0][0] == "https://example.com/file.bin"
+        assert dest_file.read_bytes() == body
+
+    @pytest.mark.unit
+    def test_download_with_retry_restarts_on_416(self, temp_dir):
+        """Test a 416 for a .part already holding the body refetches it whole."""
+        client = HTTPClient()
+        dest_file = temp_dir / "file.bin"
+        body = bytes(range(250))
+
+        # The whole body arrives before the connection drops
+        first = self._interrupted(body, {"Content-Length": "250", "ETag": '"v1"'})
+        not_satisfiable = urllib.error.HTTPError(
+            "url", 416, "Range Not Satisfiable", {}, None
+        )
+        full = FakeResponse(body)
+
+        with patch(
+            "pygit.utils.http.urlopen", side_effect=[first, not_satisfiable, full]
+        ) as mock_open:
+            with patch("time.sleep"):
+                result = client.download_with_retry(
+                    "https://example.com/file.bin", dest_file, max_retries=2
+                )
+
+        assert result is True
+        assert mock_open.call_count == 3
+        # The refetch carries neither Range nor If-Range
+        assert mock_open.call_args[0][0] == "https://example.com/file.bin"
+        assert dest_file.read_bytes() == body
+
+    @pytest.mark.unit
+    def test_download_with_retry_restarts_without_range_support(self, temp_dir):
+        """Test a 200 reply to a Range request replaces the partial data."""
+        client = HTTPClient()
+        dest_file = temp_dir / "file.bin"
+        (temp_dir / "file.bin.part").write_bytes(b"stale")
+
+        mock_response = FakeResponse(b"fresh body")
+
+        with patch(
+            "pygit.utils.http.urlopen", return_value=mock_response
+        ) as mock_open:
+            client._download(
+                "https://example.com/file.bin", dest_file, True,
+                resume=True, validators={"If-Range": '"v1"'}
+            )
+
+        assert mock_open.call_args[0][0].get_header("Range") == "bytes=5-"
+        assert dest_file.read_bytes() == b"fresh body"
+
+    @pytest.mark.unit
+    def test_retry_honors_retry_after(self, temp_dir):
+        """Test a 429 Retry-After header sets the minimum retry delay."""
+        client = HTTPClient(base_delay=0.1)
 
         import urllib.error
         error = urllib.error.HTTPError(
-            "url", 500, "Error", {}, None
+            "url", 429, "Too Many Requests", {"Retry-After": "7"}, None
         )
 
-        with patch("urllib.request.urlopen", side_effect=error):
-            with patch("time.sleep"):  # Skip actual sleep
+        with patch("pygit.utils.http.urlopen", side_effect=error) as mock_open:
+            with patch("time.sleep") as mock_sleep:
                 result = client.download_with_retry(
                     "https://example.com/file.txt",
-                    dest_file,
-                    max_retries=3
+                    temp_dir / "file.txt",
+                    max_retries=2
                 )
 
         assert result is False
+        assert mock_open.call_count == 2
+        assert mock_sleep.call_args.args[0] >= 7
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("retry_after", [
+        "inf",
+        "nan",
+        "-5",
+        "1e9",
+        "99999999999",
+        "Fri, 31 Dec 9999 23:59:59 GMT",
+    ])
+    def test_retry_after_is_bounded(self, temp_dir, retry_after):
+        """Test invalid or huge Retry-After values never exceed max_delay."""
+        client = HTTPClient(base_delay=1.0, max_delay=30.0)
+
+        import urllib.error
+        error = urllib.error.HTTPError(
+            "url", 503, "Unavailable", {"Retry-After": retry_after}, None
+        )
+
+        with patch("pygit.utils.http.urlopen", side_effect=error):
+            with patch("time.sleep") as mock_sleep:
+                result = client.download_with_retry(
+                    "https://example.com/file.txt",
+                    temp_dir / "file.txt",
+                    max_retries=2
+                )
+
+        assert result is False
+        assert 0 <= mock_sleep.call_args.args[0] <= 30.0
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("value, expected", [
+        ("7", 7.0),
+        (" 12 ", 12.0),
+        ("inf", 0.0),
+        ("-5", 0.0),
+        ("1.5", 0.0),
+        ("soon", 0.0),
+    ])
+    def test_retry_after_parsing(self, value, expected):
+        """Test only integer delay-seconds or HTTP-dates are accepted."""
+        import urllib.error
+        error = urllib.error.HTTPError("url", 429, "", {"Retry-After": value}, None)
+
+        assert HTTPClient._retry_after(error) == expected
+
+    @pytest.mark.unit
+    def test_retry_backoff_full_jitter(self, temp_dir):
+        """Test retry sleeps stay within the exponential backoff caps."""
+        client = HTTPClient(base_delay=1.0, max_delay=3.0)
+
+        import urllib.error
+        error = urllib.error.HTTPError("url", 500, "Error", {}, None)
+
+        random.seed(1234)
+        with patch("pygit.utils.http.urlopen", side_effect=error):
+            with patch("time.sleep") as mock_sleep:
+                client.download_with_retry(
+                    "https://example.com/file.txt",
+                    temp_dir / "file.txt",
+                    max_retries=5
+                )
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        assert len(delays) == 4
+        for attempt, delay in enumerate(delays):
+            assert 0 <= delay <= min(1.0 * 2**attempt, 3.0)
+
+    @pytest.mark.unit
+    def test_retry_backoff_without_jitter(self):
+        """Test backoff without jitter doubles up to max_delay."""
+        client = HTTPClient(base_delay=1.0, max_delay=5.0, jitter=False)
+
+        assert [client._backoff_delay(a) for a in range(5)] == [1, 2, 4, 5, 5]
+
+    @pytest.mark.unit
+    def test_circuit_breaker_opens_after_5_fails(self, temp_dir):
+        """Test a host failing repeatedly is skipped without a request."""
+        client = HTTPClient()
+
+        error = urllib.error.HTTPError("url", 503, "Unavailable", {}, None)
+
+        with patch("pygit.utils.http.urlopen", side_effect=error) as mock_open:
+            with patch("time.monotonic", return_value=100.0):
+                results = [
+                    client.download_with_retry(
+                        f"https://example.com/{i}", temp_dir / f"{i}.txt",
+                        max_retries=1
+                    )
+                    for i in range(6)
+                ]
+                other_host = client.download_with_retry(
+                    "https://mirror.example.org/0", temp_dir / "other.txt",
+                    max_retries=1
+                )
+
+        assert results == [False] * 6
+        assert other_host is False
+        # Five failures open the circuit for example.com only; its sixth
+        # call is skipped while the other host is still requested
+        assert mock_open.call_count == 6
+        assert mock_open.call_args[0][0] == "https://mirror.example.org/0"
+
+    @pytest.mark.unit
+    def test_circuit_breaker_half_open_after_cooldown(self, temp_dir):
+        """Test one probe is allowed after the cool-down and closes the circuit."""
+        from pygit.utils.http import BREAKER_THRESHOLD, BREAKER_WINDOW
+        client = HTTPClient()
+        url = "https://example.com/file.txt"
+
+        error = urllib.error.HTTPError("url", 500, "Error", {}, None)
+
+        def download():
+            return client.download_with_retry(url, temp_dir / "f", max_retries=1)
+
+        with patch("time.monotonic", return_value=0.0):
+            with patch("pygit.utils.http.urlopen", side_effect=error):
+                for _ in range(BREAKER_THRESHOLD):
+                    download()
+
+        # A failed probe reopens the circuit immediately
+        with patch("time.monotonic", return_value=BREAKER_WINDOW):
+            with patch("pygit.utils.http.urlopen", side_effect=error) as mock_open:
+                assert download() is False
+                assert download() is False
+        assert mock_open.call_count == 1
+
+        # A successful probe closes it again
+        with patch("time.monotonic", return_value=2 * BREAKER_WINDOW):
+            with patch(
+                "pygit.utils.http.urlopen",
+                side_effect=lambda *args, **kwargs: FakeResponse(b"ok"),
+            ) as mock_open:
+                assert download() is True
+                assert download() is True
+        assert mock_open.call_count == 2
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("error", [
+        PermissionError("permission denied"),
+        urllib.error.HTTPError("url", 404, "Not Found", {}, None),
+        urllib.error.HTTPError("url", 429, "Slow Down", {}, None),
+    ])
+    def test_circuit_breaker_ignores_non_host_failures(self, temp_dir, error):
+        """Test local errors and non-5xx responses never open the circuit."""
+        import pygit.utils.http as http_module
+        client = HTTPClient()
+
+        with patch("pygit.utils.http.urlopen", side_effect=error) as mock_open:
+            with patch("time.sleep"):
+                for i in range(6):
+                    client.download_with_retry(
+                        f"https://example.com/{i}", temp_dir / f"{i}.txt",
+                        max_retries=1
+                    )
+
+        assert mock_open.call_count == 6
+        assert "example.com" not in http_module._breaker
+
+    @pytest.mark.unit
+    def test_circuit_breaker_half_open_allows_one_probe(self):
+        """Test only one caller probes a host once the cool-down has passed."""
+        from pygit.utils.http import (
+            BREAKER_THRESHOLD, BREAKER_WINDOW, _circuit_allows, _record_host_result
+        )
+
+        with patch("time.monotonic", return_value=0.0):
+            for _ in range(BREAKER_THRESHOLD):
+                _record_host_result("example.com", True)
+            assert _circuit_allows("example.com") is False
+
+        with patch("time.monotonic", return_value=BREAKER_WINDOW):
+            assert _circuit_allows("example.com") is True
+            assert _circuit_allows("example.com") is False
+            # A probe that says nothing about the host frees the slot
+            _record_host_result("example.com", None)
+            assert _circuit_allows("example.com") is True
+            _record_host_result("example.com", False)
+            assert _circuit_allows("example.com") is True
+            assert _circuit_allows("example.com") is True
+
+    @pytest.mark.unit
+    def test_circuit_breaker_probe_released_on_part_error(self, temp_dir):
+        """Test a probe that cannot clear its .part file frees the probe slot."""
+        from pygit.utils.http import (
+            BREAKER_THRESHOLD, BREAKER_WINDOW, _circuit_allows, _record_host_result
+        )
+        client = HTTPClient()
+        # A directory where the .part file should be makes unlink fail
+        (temp_dir / "file.txt.part").mkdir()
+
+        with patch("time.monotonic", return_value=0.0):
+            for _ in range(BREAKER_THRESHOLD):
+                _record_host_result("example.com", True)
+
+        with patch("time.monotonic", return_value=BREAKER_WINDOW):
+            with patch("pygit.utils.http.urlopen") as mock_open:
+                result = client.download_with_retry(
+                    "https://example.com/file.txt", temp_dir / "file.txt"
+                )
+            assert _circuit_allows("example.com") is True
+
+        assert result is False
+        mock_open.assert_not_called()
+
+
+class TestHTTPClientDownloadMany:
+    """Tests for concurrent downloads."""
+
+    @pytest.mark.unit
+    def test_download_many_parallel(self, temp_dir):
+        """Test downloads run concurrently up to max_workers."""
+        client = HTTPClient()
+        jobs = [(f"https://example.com/{i}", temp_dir / f"{i}.txt") for i in range(4)]
+        # Every download waits here; this only completes if all four overlap
+        barrier = threading.Barrier(4, timeout=5)
+
+        def mock_urlopen(url, timeout=None):
+            barrier.wait()
+            return FakeResponse(url.encode())
+
+        with patch("pygit.utils.http.urlopen", side_effect=mock_urlopen):
+            results = client.download_many(jobs, max_workers=4)
+
+        assert results == {url: True for url, _ in jobs}
+        for url, dest in jobs:
+            assert dest.read_bytes() == url.encode()
+
+    @pytest.mark.unit
+    def test_download_many_partial_failure(self, temp_dir):
+        """Test one missing file does not fail the other downloads."""
+        client = HTTPClient()
+        jobs = [
+            ("https://example.com/ok", temp_dir / "ok.txt"),
+            ("https://example.com/missing", temp_dir / "missing.txt"),
+        ]
+
+        import urllib.error
+
+        def mock_urlopen(url, timeout=None):
+            if url.endswith("missing"):
+                raise urllib.error.HTTPError(url, 404, "Not Found", {}, None)
+            return FakeResponse(b"ok")
+
+        with patch("pygit.utils.http.urlopen", side_effect=mock_urlopen):
+            results = client.download_many(jobs)
+
+        assert results == {
+            "https://example.com/ok": True,
+            "https://example.com/missing": False,
+        }
 
 
 class TestHTTPClientRequest:
@@ -241,12 +724,9 @@ class TestHTTPClientRequest:
         """Test successful request."""
         client = HTTPClient()
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b'{"key": "value"}'
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_response = FakeResponse(b'{"key": "value"}')
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
             result = client.make_request("https://example.com/api")
 
         assert result == b'{"key": "value"}'
@@ -256,25 +736,76 @@ class TestHTTPClientRequest:
         """Test request with custom headers."""
         client = HTTPClient()
 
-        mock_response = MagicMock()
-        mock_response.read.return_value = b"response"
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
-
-        with patch("urllib.request.urlopen", return_value=mock_response) as mock_open:
-            with patch("urllib.request.Request") as mock_request_class:
-                mock_request = MagicMock()
-                mock_request_class.return_value = mock_request
+        mock_response = FakeResponse(b"response")
 
+        with patch("pygit.utils.http.urlopen", return_value=mock_response) as mock_open:
+            with patch("pygit.utils.http.Request") as mock_request_class:
                 client.make_request(
                     "https://example.com/api",
                     headers={"Authorization": "Bearer token"}
                 )
 
-                mock_request.add_header.assert_called_with(
-                    "Authorization", "Bearer token"
+                assert mock_request_class.call_args.kwargs["headers"] == {
+                    "Accept-Encoding": "gzip, deflate",
+                    "Authorization": "Bearer token",
+                }
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("count", [1, 20])
+    def test_make_request_builds_request_once(self, count):
+        """Test all headers are set by a single Request construction."""
+        client = HTTPClient()
+        headers = {f"X-Header-{i}": str(i) for i in range(count)}
+
+        mock_response = FakeResponse(b"response")
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            with patch("pygit.utils.http.Request") as mock_request_class:
+                client.make_request("https://example.com/api", headers=headers)
+
+        mock_request_class.assert_called_once_with(
+            "https://example.com/api",
+            headers={"Accept-Encoding": "gzip, deflate", **headers},
+        )
+        mock_request_class.return_value.add_header.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("encoding, compress", [
+        ("gzip", gzip.compress),
+        ("deflate", zlib.compress),
+        ("deflate", lambda data: zlib.compress(data)[2:-4]),  # raw deflate
+    ])
+    def test_make_request_decompresses_body(self, encoding, compress):
+        """Test compressed responses are decoded transparently."""
+        client = HTTPClient()
+
+        mock_response = FakeResponse(
+            compress(b'{"k":"v"}'), {"Content-Encoding": encoding}
+        )
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response):
+            result = client.make_request("https://example.com/api")
+
+        assert result == b'{"k":"v"}'
+
+    @pytest.mark.unit
+    def test_make_request_builds_fresh_request_per_call(self):
+        """Test identical calls never share a Request, which urlopen mutates."""
+        client = HTTPClient()
+
+        with patch(
+            "pygit.utils.http.urlopen",
+            side_effect=lambda *args, **kwargs: FakeResponse(b"response"),
+        ) as mock_open:
+            for _ in range(2):
+                client.make_request(
+                    "https://example.com/api",
+                    headers={"Authorization": "Bearer token"}
                 )
 
+        first, second = (call.args[0] for call in mock_open.call_args_list)
+        assert first is not second
+
     @pytest.mark.unit
     def test_make_request_error(self):
         """Test request error handling."""
@@ -285,7 +816,7 @@ class TestHTTPClientRequest:
             "url", 401, "Unauthorized", {}, None
         )
 
-        with patch("urllib.request.urlopen", side_effect=error):
+        with patch("pygit.utils.http.urlopen", side_effect=error):
             result = client.make_request("https://example.com/api")
 
         assert result is None
@@ -297,19 +828,130 @@ class TestConvenienceFunctions:
     @pytest.mark.unit
     def test_is_url_accessible_true(self):
         """Test URL accessibility check returns true."""
-        mock_response = MagicMock()
-        mock_response.__enter__ = MagicMock(return_value=mock_response)
-        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_response = FakeResponse()
+
+        with patch("pygit.utils.http.urlopen", return_value=mock_response) as mock_open:
+            result = is_url_accessible("https://example.com")
+
+        assert result is True
+        assert mock_open.call_args[0][0].get_method() == "HEAD"
 
-        with patch("urllib.request.urlopen", return_value=mock_response):
+    @pytest.mark.unit
+    def test_is_url_accessible_405_fallback(self):
+        """Test servers rejecting HEAD are probed with a one-byte GET."""
+        mock_response = FakeResponse()
+
+        import urllib.error
+        error = urllib.error.HTTPError("url", 405, "Method Not Allowed", {}, None)
+
+        with patch(
+            "pygit.utils.http.urlopen", side_effect=[error, mock_response]
+        ) as mock_open:
             result = is_url_accessible("https://example.com")
 
         assert result is True
+        fallback = mock_open.call_args[0][0]
+        assert fallback.get_method() == "GET"
+        assert fallback.get_header("Range") == "bytes=0-0"
+
+    @pytest.mark.unit
+    def test_is_url_accessible_reuses_client(self, monkeypatch):
+        """Test convenience checks share one lazily created client."""
+        import pygit.utils.http as http_module
+        monkeypatch.setattr(http_module, "_default_client", None)
+
+        with patch.object(
+            http_module, "HTTPClient", wraps=HTTPClient
+        ) as mock_client_class:
+            with patch("pygit.utils.http.urlopen", side_effect=OSError):
+                is_url_accessible("https://example.com/a")
+                is_url_accessible("https://example.com/b")
+
+        assert mock_client_class.call_count == 1
 
     @pytest.mark.unit
     def test_is_url_accessible_false(self):
         """Test URL accessibility check returns false."""
-        with patch("urllib.request.urlopen", side_effect=Exception("Error")):
+        with patch("pygit.utils.http.urlopen", side_effect=Exception("Error")):
             result = is_url_accessible("https://example.com")
 
         assert result is False
+
+
+class TestDNSCache:
+    """Tests for the opt-in DNS resolution cache."""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        import pygit.utils.http as http_module
+        monkeypatch.setattr(http_module, "_dns_cache", OrderedDict())
+
+    @pytest.mark.unit
+    def test_dns_cache_hit_no_resolver(self):
+        """Test repeated lookups of one host resolve it only once."""
+        from pygit.utils.http import _cached_getaddrinfo
+
+        address = [(2, 1, 6, "", ("93.184.216.34", 443))]
+        with patch(
+            "pygit.utils.http._system_getaddrinfo", return_value=address
+        ) as mock_resolve:
+            results = [_cached_getaddrinfo("example.com", 443) for _ in range(10)]
+
+        assert mock_resolve.call_count == 1
+        assert all(result == address for result in results)
+
+    @pytest.mark.unit
+    def test_dns_cache_expires_after_ttl(self):
+        """Test entries are resolved again once DNS_CACHE_TTL has passed."""
+        from pygit.utils.http import DNS_CACHE_TTL, _cached_getaddrinfo
+
+        with patch(
+            "pygit.utils.http._system_getaddrinfo", return_value=[]
+        ) as mock_resolve:
+            with patch("time.monotonic", return_value=0.0):
+                _cached_getaddrinfo("example.com", 443)
+                _cached_getaddrinfo("example.com", 80)
+            with patch("time.monotonic", return_value=DNS_CACHE_TTL + 1):
+                _cached_getaddrinfo("example.com", 443)
+
+        assert mock_resolve.call_count == 3
+
+    @pytest.mark.unit
+    def test_dns_cache_drops_expired_entries(self):
+        """Test a lookup miss removes entries whose TTL has passed."""
+        import pygit.utils.http as http_module
+        from pygit.utils.http import DNS_CACHE_TTL, _cached_getaddrinfo
+
+        with patch("pygit.utils.http._system_getaddrinfo", return_value=[]):
+            with patch("time.monotonic", return_value=0.0):
+                for i in range(10):
+                    _cached_getaddrinfo(f"host{i}.example.com", 443)
+            with patch("time.monotonic", return_value=DNS_CACHE_TTL + 1):
+                _cached_getaddrinfo("other.example.com", 443)
+
+        assert [key[0] for key in http_module._dns_cache] == ["other.example.com"]
+
+    @pytest.mark.unit
+    def test_dns_cache_size_is_bounded(self, monkeypatch):
+        """Test the oldest entries are dropped beyond DNS_CACHE_SIZE."""
+        import pygit.utils.http as http_module
+        monkeypatch.setattr(http_module, "DNS_CACHE_SIZE", 3)
+
+        with patch("pygit.utils.http._system_getaddrinfo", return_value=[]):
+            for i in range(5):
+                http_module._cached_getaddrinfo(f"host{i}.example.com", 443)
+
+        assert [key[0] for key in http_module._dns_cache] == [
+            "host2.example.com", "host3.example.com", "host4.example.com"
+        ]
+
+    @pytest.mark.unit
+    def test_install_dns_cache(self, monkeypatch):
+        """Test installing the cache replaces socket.getaddrinfo."""
+        import socket
+        from pygit.utils.http import _cached_getaddrinfo, _install_dns_cache
+
+        monkeypatch.setattr(socket, "getaddrinfo", socket.getaddrinfo)
+        _install_dns_cache()
+
+        assert socket.getaddrinfo is _cached_getaddrinfo